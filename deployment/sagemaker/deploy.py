@@ -1,9 +1,22 @@
 '''Composite deployment script for SageMaker endpoints.'''
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from . import nim_embedding_endpoint, nim_llm_endpoint
 
 
 def deploy_all() -> None:
-    '''Deploy both Nemotron endpoints.'''
-    nim_llm_endpoint.deploy_nim_llm()
-    nim_embedding_endpoint.deploy_nim_embedding()
+    '''Deploy both Nemotron endpoints concurrently; they do not depend on each other.'''
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(nim_llm_endpoint.deploy_nim_llm),
+            executor.submit(nim_embedding_endpoint.deploy_nim_embedding),
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop on the first failure; cancel() only skips deployments that have not started.
+            for future in futures:
+                future.cancel()
+            raise
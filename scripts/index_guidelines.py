@@ -11,8 +11,8 @@ import typer
 
 from src.guidelines.indexer import GuidelineIndexer
 from src.services.nim_embeddings import EmbeddingClient, NIMServiceError
-from src.services.vector_store import VectorStore, VectorStoreError
-from src.utils.config import get_settings
+from src.services.vector_store import BULK_MAX_CHUNK_BYTES, VectorStore, VectorStoreError
+from src.utils.config import Settings
 from src.utils.logger import get_logger
 
 app = typer.Typer(help="Index medical guideline markdown files into the vector store.")
@@ -20,14 +20,6 @@ app = typer.Typer(help="Index medical guideline markdown files into the vector s
 DEFAULT_GUIDELINE_DIR = Path("data/guidelines")
 
 
-def _refresh_settings() -> None:
-    """Reload cached settings so newly-set env vars are respected."""
-
-    # get_settings is lru-cached; clear so changes take effect for scripts.
-    get_settings.cache_clear()  # type: ignore[attr-defined]
-    get_settings()
-
-
 def _normalise_dir(value: Optional[Path]) -> Path:
     if value is None:
         return DEFAULT_GUIDELINE_DIR
@@ -48,12 +40,36 @@ def run(
         help="Target vector store index name.",
     ),
     batch_size: int = typer.Option(
-        50,
+        32,
         "--batch-size",
         min=1,
         max=500,
         help="Number of chunks to upsert per bulk request.",
     ),
+    bulk_size_bytes: int = typer.Option(
+        BULK_MAX_CHUNK_BYTES,
+        "--bulk-size-bytes",
+        min=1,
+        help="Maximum payload size in bytes for a single bulk request.",
+    ),
+    upload_concurrency: int = typer.Option(
+        2,
+        "--upload-concurrency",
+        min=1,
+        max=16,
+        help="Number of bulk requests sent to the vector store concurrently.",
+    ),
+    pipelined: bool = typer.Option(
+        False,
+        "--async",
+        help="Overlap embedding requests and bulk writes using an asyncio pipeline.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Processes used to load and chunk large guideline sets (default: chunk in-process).",
+    ),
     drop_existing: bool = typer.Option(
         False,
         "--drop-existing",
@@ -78,11 +94,13 @@ def run(
     if local:
         os.environ.setdefault("OPENSEARCH_ENDPOINT", "http://localhost:9200")
 
-    _refresh_settings()
+    # Build settings once after any env overrides; the cached get_settings()
+    # instance may predate them, so clients receive this instance explicitly.
+    settings = Settings()
     logger = get_logger("scripts.index_guidelines")
 
     try:
-        embedding_client = EmbeddingClient()
+        embedding_client = EmbeddingClient(settings=settings)
     except NIMServiceError as exc:
         typer.secho(f"Embedding client initialisation failed: {exc}", fg=typer.colors.RED, err=True)
         typer.echo(
@@ -91,7 +109,7 @@ def run(
         raise typer.Exit(code=2) from exc
 
     try:
-        vector_store = VectorStore(index_name=index_name)
+        vector_store = VectorStore(index_name=index_name, settings=settings, verify_mapping=not drop_existing)
     except VectorStoreError as exc:
         typer.secho(f"Vector store initialisation failed: {exc}", fg=typer.colors.RED, err=True)
         typer.echo("Check OPENSEARCH_ENDPOINT, AWS_REGION, and credentials.")
@@ -100,12 +118,10 @@ def run(
     if drop_existing:
         typer.echo(f"Dropping existing index '{index_name}'...")
         try:
-            vector_store.delete_index()
+            vector_store.recreate_index()
         except VectorStoreError as exc:
-            typer.secho(f"Failed to delete index '{index_name}': {exc}", fg=typer.colors.RED, err=True)
+            typer.secho(f"Failed to recreate index '{index_name}': {exc}", fg=typer.colors.RED, err=True)
             raise typer.Exit(code=4) from exc
-        # Recreate the index by instantiating a fresh client.
-        vector_store = VectorStore(index_name=index_name)
 
     indexer = GuidelineIndexer()
     typer.echo(
@@ -119,6 +135,10 @@ def run(
             embedding_client=embedding_client,
             vector_store=vector_store,
             batch_size=batch_size,
+            bulk_size_bytes=bulk_size_bytes,
+            pipelined=pipelined,
+            workers=workers,
+            upload_concurrency=upload_concurrency,
         )
     except (NIMServiceError, VectorStoreError, FileNotFoundError, ValueError) as exc:
         logger.error(
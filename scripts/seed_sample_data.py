@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional
 
 import typer
+from rich.progress import track
 
 from src.parsers.fhir_parser import FHIRParser
 from src.services.ehr_client import EHRClient
@@ -15,6 +20,11 @@ from src.tasks.fhir_builder import FHIRServiceRequestBuilder
 from src.tasks.generator import TaskGenerator
 from src.utils.logger import get_logger
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 app = typer.Typer(help="Seed mock EHR data and generated follow-up orders for demos.")
 
 DEFAULT_REPORT_DIR = Path("data/sample_reports")
@@ -32,18 +42,33 @@ def _ensure_directory(path: Path) -> None:
 
 
 def _iter_json_files(directory: Path) -> Iterable[Path]:
-    for path in sorted(directory.glob("*.json")):
+    """Yield sample files that have a recipe, skipping the rest without reading them."""
+
+    with os.scandir(directory) as entries:
+        names = sorted(
+            entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()
+        )
+    for name in names:
+        path = directory / name
+        if path.stem not in _RECIPE_KEYS:
+            LOGGER.warning(
+                "Skipping sample without recipe.",
+                extra={"context": {"file": str(path)}},
+            )
+            continue
         yield path
 
 
 def _load_json(path: Path) -> Dict:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except (OSError, json.JSONDecodeError) as exc:  # pragma: no cover - I/O guard
         raise SeedError(f"Failed to read sample file '{path}': {exc}") from exc
 
 
-SAMPLE_RECIPES: Dict[str, Dict[str, Dict[str, object]]] = {
+SAMPLE_RECIPES: Mapping[str, Dict[str, Dict[str, object]]] = MappingProxyType({
     "chest_ct_ggo_fhir": {
         "finding": {
             "type": "pulmonary_nodule",
@@ -92,11 +117,20 @@ SAMPLE_RECIPES: Dict[str, Dict[str, Dict[str, object]]] = {
             "citation": "ACR Incidental Liver Lesions 2017",
         },
     },
-}
+})
+_RECIPE_KEYS = frozenset(SAMPLE_RECIPES)
 
 
-def _resolve_recipe(stem: str) -> Optional[Dict[str, Dict[str, object]]]:
-    return SAMPLE_RECIPES.get(stem)
+def _encode_record(record: Dict[str, object]) -> bytes:
+    """Serialise a record as a single JSON Lines entry."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            record,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
 
 
 def _derive_patient_id(reference: Optional[str], fallback: str = "patient-demo") -> str:
@@ -105,6 +139,77 @@ def _derive_patient_id(reference: Optional[str], fallback: str = "patient-demo")
     return reference.split("/")[-1] or fallback
 
 
+def _process_report(
+    file_path: Path,
+    *,
+    parser: FHIRParser,
+    generator: TaskGenerator,
+    builder: FHIRServiceRequestBuilder,
+    ehr_client: EHRClient,
+    dry_run: bool,
+    mock: bool,
+) -> Optional[Dict[str, object]]:
+    """Build (and optionally submit) the follow-up order for one sample report."""
+
+    stem = file_path.stem
+    recipe = SAMPLE_RECIPES[stem]
+    payload = _load_json(file_path)
+    report_id = payload.get("id") or stem
+    patient_ref = (payload.get("subject") or {}).get("reference")
+    patient_id = _derive_patient_id(patient_ref)
+
+    try:
+        report_text, patient_meta = parser.parse_diagnostic_report(payload)
+    except ValueError as exc:
+        LOGGER.error(
+            "Failed to parse DiagnosticReport.",
+            extra={"context": {"file": str(file_path), "error": str(exc)}},
+        )
+        return None
+
+    if patient_meta.get("patient_id"):
+        patient_id = patient_meta["patient_id"] or patient_id
+
+    try:
+        task = generator.generate_task(
+            recipe["recommendation"],
+            recipe["finding"],
+            patient_id=patient_id,
+        )
+    except ValueError as exc:
+        LOGGER.error(
+            "Could not generate follow-up task.",
+            extra={"context": {"file": str(file_path), "error": str(exc)}},
+        )
+        return None
+
+    service_request = builder.build_service_request(
+        task,
+        diagnostic_report_id=report_id,
+    )
+
+    order_id: str
+    if dry_run:
+        order_id = task.task_id
+    else:
+        order_id = ehr_client.create_service_request(service_request)
+        service_request["id"] = order_id
+
+    created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return {
+        "created_at": created_at,
+        "report_file": str(file_path),
+        "report_id": report_id,
+        "order_id": order_id,
+        "patient_id": patient_id,
+        "task": task.to_dict(),
+        "service_request": service_request,
+        "report_excerpt": report_text[:280],
+        "patient_metadata": patient_meta,
+        "mode": "mock" if mock else "remote",
+    }
+
+
 @app.command("run")
 def run(
     reports_dir: Path = typer.Option(
@@ -134,6 +239,12 @@ def run(
         "--dry-run",
         help="Do not persist anything; print the payloads that would be stored.",
     ),
+    workers: int = typer.Option(
+        8,
+        "--workers",
+        min=1,
+        help="Number of sample reports to process concurrently.",
+    ),
 ) -> None:
     """
     Generate example follow-up ServiceRequests for the bundled sample reports.
@@ -149,93 +260,41 @@ def run(
     builder = FHIRServiceRequestBuilder()
     ehr_client = EHRClient(base_url=base_url, use_mock=mock)
 
-    created_records: List[Dict[str, object]] = []
-
-    for file_path in _iter_json_files(reports_dir):
-        stem = file_path.stem
-        recipe = _resolve_recipe(stem)
-        if recipe is None:
-            LOGGER.warning(
-                "Skipping sample without recipe.",
-                extra={"context": {"file": str(file_path)}},
-            )
-            continue
-
-        payload = _load_json(file_path)
-        report_id = payload.get("id") or stem
-        patient_ref = payload.get("subject", {}).get("reference")
-        patient_id = _derive_patient_id(patient_ref)
-
-        try:
-            report_text, patient_meta = parser.parse_diagnostic_report(payload)
-        except ValueError as exc:
-            LOGGER.error(
-                "Failed to parse DiagnosticReport.",
-                extra={"context": {"file": str(file_path), "error": str(exc)}},
-            )
-            continue
-
-        if patient_meta.get("patient_id"):
-            patient_id = patient_meta["patient_id"] or patient_id
-
-        try:
-            task = generator.generate_task(
-                recipe["recommendation"],
-                recipe["finding"],
-                patient_id=patient_id,
-            )
-        except ValueError as exc:
-            LOGGER.error(
-                "Could not generate follow-up task.",
-                extra={"context": {"file": str(file_path), "error": str(exc)}},
-            )
-            continue
-
-        service_request = builder.build_service_request(
-            task,
-            diagnostic_report_id=report_id,
-        )
-
-        order_id: str
-        if dry_run:
-            order_id = task.task_id
-        else:
-            order_id = ehr_client.create_service_request(service_request)
-            service_request["id"] = order_id
-
-        created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        record = {
-            "created_at": created_at,
-            "report_file": str(file_path),
-            "report_id": report_id,
-            "order_id": order_id,
-            "patient_id": patient_id,
-            "task": task.to_dict(),
-            "service_request": service_request,
-            "report_excerpt": report_text[:280],
-            "patient_metadata": patient_meta,
-            "mode": "mock" if mock else "remote",
-        }
-        created_records.append(record)
-
-        typer.secho(
-            f"Generated follow-up order {order_id} for report {report_id} ({stem}).",
-            fg=typer.colors.GREEN,
-        )
+    process = partial(
+        _process_report,
+        parser=parser,
+        generator=generator,
+        builder=builder,
+        ehr_client=ehr_client,
+        dry_run=dry_run,
+        mock=mock,
+    )
+    files = list(_iter_json_files(reports_dir))
+    created_records: List[Optional[Dict[str, object]]] = [None] * len(files)
+    created_count = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(process, files)
+        for record in track(results, total=len(files), description="Seeding sample orders..."):
+            if record is None:
+                continue
+            created_records[created_count] = record
+            created_count += 1
+    del created_records[created_count:]
 
     if not created_records:
         typer.echo("No sample records were generated.")
         return
 
+    typer.secho(
+        f"Generated {len(created_records)} follow-up orders from {len(files)} sample reports.",
+        fg=typer.colors.GREEN,
+    )
     if dry_run:
         typer.echo("Dry run complete; nothing persisted.")
         return
 
     _ensure_directory(output_path)
-    with output_path.open("w", encoding="utf-8") as handle:
-        for record in created_records:
-            handle.write(json.dumps(record, default=str))
-            handle.write("\n")
+    output_path.write_bytes(b"".join(_encode_record(record) for record in created_records))
 
     typer.echo(f"Wrote {len(created_records)} records to {output_path}.")
 
@@ -8,7 +8,7 @@ from typing import Optional
 
 import typer
 
-from src.utils.config import get_settings
+from src.utils.config import Settings
 from src.utils.logger import get_logger
 from typing import TYPE_CHECKING
 
@@ -19,11 +19,6 @@ if TYPE_CHECKING:  # pragma: no cover - import only for type checking
 app = typer.Typer(help="Smoke-test Nemotron (LLM) and NV-Embed connectivity.")
 
 
-def _refresh_settings() -> None:
-    get_settings.cache_clear()  # type: ignore[attr-defined]
-    get_settings()
-
-
 @app.command("run")
 def run(
     sample_text: str = typer.Option(
@@ -49,7 +44,7 @@ def run(
     """
 
     logger = get_logger("scripts.test_nim_connection")
-    _refresh_settings()
+    settings = Settings()
 
     if not include_embeddings and not include_llm:
         typer.secho("Nothing to test. Enable at least one NIM check.", fg=typer.colors.YELLOW)
@@ -59,7 +54,7 @@ def run(
         from src.services.nim_embeddings import EmbeddingClient, NIMServiceError as EmbeddingError  # noqa: WPS433
 
         try:
-            embed_client = EmbeddingClient()
+            embed_client = EmbeddingClient(settings=settings)
         except EmbeddingError as exc:
             typer.secho(f"Embedding client initialisation failed: {exc}", fg=typer.colors.RED, err=True)
             raise typer.Exit(code=2) from exc
@@ -86,7 +81,7 @@ def run(
         from src.services.nim_llm import NemotronClient, NIMServiceError as LLMError  # noqa: WPS433
 
         try:
-            llm_client = NemotronClient()
+            llm_client = NemotronClient(settings=settings)
         except LLMError as exc:
             typer.secho(f"Nemotron client initialisation failed: {exc}", fg=typer.colors.RED, err=True)
             raise typer.Exit(code=4) from exc
@@ -257,10 +257,10 @@ class AuDRAAgent:
             raise
 
         action_name, action_input = self._parse_react_response(response)
-        if action_name == "FINISH" or action_name not in TOOLS:
+        handler = TOOLS.get(action_name)
+        if handler is None:
             return state, "FINISH", {"message": "Agent elected to finish."}
 
-        handler = TOOLS[action_name]
         try:
             if action_name == "parse_report":
                 return handler(state)
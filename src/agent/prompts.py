@@ -2,6 +2,9 @@ from __future__ import annotations
 
 """Prompt templates used by the AuDRA-Rad agent."""
 
+from string import Formatter
+from typing import Callable, Dict, List, Tuple
+
 
 SYSTEM_PROMPT = """You are AuDRA-Rad, an AI assistant for radiology follow-up recommendations.
 
@@ -137,7 +140,56 @@ Continue until all findings have follow-up tasks or are flagged for review.
 """
 
 
+PromptRenderer = Callable[..., str]
+
+
+def _compile_template(template: str) -> PromptRenderer:
+    """Pre-parse ``template`` once so rendering only joins literal and field parts."""
+
+    segments: List[Tuple[str, str]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or format_spec or conversion
+        ):
+            # Indexed/attribute fields and format specs need the full formatter.
+            return lambda _template=template, **kwargs: _template.format_map(kwargs)
+        segments.append((literal, field_name or ""))
+
+    def _render(**kwargs: str) -> str:
+        parts: List[str] = []
+        for literal, field_name in segments:
+            parts.append(literal)
+            if field_name:
+                parts.append(str(kwargs[field_name]))
+        return "".join(parts)
+
+    return _render
+
+
+_COMPILED: Dict[str, PromptRenderer] = {
+    name: _compile_template(template)
+    for name, template in {
+        "SYSTEM_PROMPT": SYSTEM_PROMPT,
+        "PARSE_PROMPT": PARSE_PROMPT,
+        "ANALYZE_PROMPT": ANALYZE_PROMPT,
+        "VALIDATE_PROMPT": VALIDATE_PROMPT,
+        "REACT_PROMPT": REACT_PROMPT,
+    }.items()
+}
+_COMPILED_BY_TEMPLATE: Dict[str, PromptRenderer] = {
+    globals()[name]: renderer for name, renderer in _COMPILED.items()
+}
+
+
 def format_prompt(template: str, **kwargs: str) -> str:
-    """Fill in template placeholders with provided values."""
+    """Fill in template placeholders with provided values.
+
+    ``template`` may be the name of a bundled prompt (e.g. ``"REACT_PROMPT"``),
+    one of the prompt constants, or any other format string; bundled prompts
+    use renderers compiled at import time.
+    """
 
-    return template.format(**kwargs)
+    renderer = _COMPILED.get(template) or _COMPILED_BY_TEMPLATE.get(template)
+    if renderer is None:
+        return template.format(**kwargs)
+    return renderer(**kwargs)
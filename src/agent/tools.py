@@ -29,6 +29,8 @@ from src.utils.logger import get_logger
 
 _LOGGER = get_logger("audra.agent.tools")
 
+SUSPICIOUS_CHARACTERISTICS = frozenset({"spiculated", "irregular"})
+
 
 @dataclass
 class TaskGenerator:
@@ -337,8 +339,8 @@ def validate_safety_tool(
         if isinstance(size_mm, (int, float)) and size_mm > 30:
             concerns.append("Lesion larger than 30mm")
 
-        characteristics = set((finding or {}).get("characteristics") or [])
-        if any(term in characteristics for term in {"spiculated", "irregular"}):
+        characteristics = (finding or {}).get("characteristics") or ()
+        if not SUSPICIOUS_CHARACTERISTICS.isdisjoint(characteristics):
             concerns.append("Suspicious imaging characteristics")
 
         urgency = recommendation.get("urgency", "").lower()
@@ -2,16 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
 from contextlib import asynccontextmanager
-from pathlib import Path
+from importlib.metadata import PackageNotFoundError, version
 from typing import Any, Iterable, Optional
-from uuid import uuid4
-
-try:  # Python 3.11+
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore[no-redef, assignment]
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -19,30 +15,28 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from slowapi.middleware import SlowAPIMiddleware
 
 from src.agent.orchestrator import AuDRAAgent
-from src.api.routes import register_exception_handlers, router
+from src.api.models import bind_request_clock
+from src.api.routes import REQUEST_BODY_MODELS, register_exception_handlers, router
+from src.api.schema_examples import apply_schema_examples
 from src.services.ehr_client import EHRClient
+from src.services.http_pool import close_http_client
 from src.services.nim_embeddings import EmbeddingClient, NIMServiceError as EmbeddingServiceError
 from src.services.nim_llm import NIMServiceError, NemotronClient
 from src.services.vector_store import VectorStore, VectorStoreError
 from src.utils.config import get_settings
-from src.utils.logger import clear_correlation_id, get_logger, set_correlation_id
-
-
-def _load_version() -> str:
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
-        return "1.0.0"
-    try:
-        data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-    except (tomllib.TOMLDecodeError, OSError):  # pragma: no cover - defensive
-        return "1.0.0"
-    return data.get("project", {}).get("version", "1.0.0")
+from src.utils.logger import clear_correlation_id, get_logger, new_correlation_id, set_correlation_id
 
 
 SETTINGS = get_settings()
-APP_VERSION = _load_version()
+try:
+    APP_VERSION = version("audra-rad")
+except PackageNotFoundError:  # pragma: no cover - running from a source checkout
+    APP_VERSION = "1.0.0"
 logger = get_logger("audra.api.app")
 
+# Upper bound on agent runs in flight at once, shared by /process-report and /batch-process.
+MAX_CONCURRENT_AGENT_RUNS = 10
+
 
 def _resolve_origins(value: Optional[Iterable[str]]) -> list[str]:
     if value is None:
@@ -67,6 +61,27 @@ def _middleware_cors(app: FastAPI) -> None:
         allow_headers=["*"],
     )
 
+
+def _install_openapi(app: FastAPI) -> None:
+    """Build the OpenAPI document lazily, attaching examples and request schemas."""
+
+    default_openapi = app.openapi
+
+    def _openapi() -> dict[str, Any]:
+        if app.openapi_schema is not None:
+            return app.openapi_schema
+        schema = default_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for model in REQUEST_BODY_MODELS:
+            model_schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+            components.update(model_schema.pop("$defs", {}))
+            components[model.__name__] = model_schema
+        apply_schema_examples(components)
+        return schema
+
+    app.openapi = _openapi  # type: ignore[method-assign]
+
+
 def _initialise_services(app: FastAPI) -> None:
     logger.info("Starting AuDRA-Rad API services...")
     llm_client: Optional[NemotronClient] = None
@@ -144,14 +159,17 @@ def _shutdown_services(app: FastAPI) -> None:
             ehr_client.close()
         except Exception:  # pragma: no cover - defensive cleanup
             pass
+    close_http_client()
 
 
 @asynccontextmanager
 async def _app_lifespan(app: FastAPI):
     _initialise_services(app)
+    app.state.agent_slots = asyncio.Semaphore(MAX_CONCURRENT_AGENT_RUNS)
     try:
         yield
     finally:
+        app.state.agent_slots = None
         _shutdown_services(app)
 
 
@@ -171,6 +189,7 @@ def create_app() -> FastAPI:
     app.state.settings = SETTINGS
     app.state.version = APP_VERSION
     app.state.agent = None
+    app.state.agent_slots = None
     app.state.llm_client = None
     app.state.embedding_client = None
     app.state.vector_store = None
@@ -182,20 +201,24 @@ def create_app() -> FastAPI:
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next) -> Response:
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid4())
+        correlation_id = request.headers.get("X-Correlation-ID") or new_correlation_id()
         set_correlation_id(correlation_id)
+        bind_request_clock()
         start_time = time.perf_counter()
+        # Skip building log context on every request when INFO is filtered out.
+        log_info = logger.isEnabledFor(logging.INFO)
 
-        logger.info(
-            "Incoming request.",
-            extra={
-                "context": {
-                    "correlation_id": correlation_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                }
-            },
-        )
+        if log_info:
+            logger.info(
+                "Incoming request.",
+                extra={
+                    "context": {
+                        "correlation_id": correlation_id,
+                        "method": request.method,
+                        "path": request.url.path,
+                    }
+                },
+            )
 
         try:
             response = await call_next(request)
@@ -215,23 +238,25 @@ def create_app() -> FastAPI:
             clear_correlation_id()
             raise
 
-        duration_ms = (time.perf_counter() - start_time) * 1000.0
         response.headers["X-Correlation-ID"] = correlation_id
-        logger.info(
-            "Request completed.",
-            extra={
-                "context": {
-                    "correlation_id": correlation_id,
-                    "status_code": response.status_code,
-                    "duration_ms": duration_ms,
-                }
-            },
-        )
+        if log_info:
+            duration_ms = (time.perf_counter() - start_time) * 1000.0
+            logger.info(
+                "Request completed.",
+                extra={
+                    "context": {
+                        "correlation_id": correlation_id,
+                        "status_code": response.status_code,
+                        "duration_ms": duration_ms,
+                    }
+                },
+            )
         clear_correlation_id()
         return response
 
     register_exception_handlers(app)
     app.include_router(router, prefix="/api/v1")
+    _install_openapi(app)
 
     @app.get("/", tags=["Health"])
     async def root() -> dict[str, Any]:
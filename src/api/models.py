@@ -2,10 +2,63 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from datetime import date, datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints, WithJsonSchema
+from typing_extensions import TypedDict
+
+from src.api.vocab import Characteristic, FindingType
+
+
+# --------------------------------------------------------------------------- #
+# Request clock
+# --------------------------------------------------------------------------- #
+
+
+_REQUEST_NOW: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+_REQUEST_TODAY: ContextVar[Optional[date]] = ContextVar("request_today", default=None)
+
+
+def bind_request_clock() -> None:
+    """Capture the wall clock once for the current request context."""
+
+    _REQUEST_NOW.set(datetime.now(tz=timezone.utc))
+    _REQUEST_TODAY.set(date.today())
+
+
+def _utcnow() -> datetime:
+    return _REQUEST_NOW.get() or datetime.now(tz=timezone.utc)
+
+
+def _today() -> date:
+    return _REQUEST_TODAY.get() or date.today()
+
+
+# --------------------------------------------------------------------------- #
+# Opaque payloads
+# --------------------------------------------------------------------------- #
+
+
+def _require_object(value: Any) -> Any:
+    """Reject non-object payloads without inspecting their contents."""
+
+    if value is not None and not isinstance(value, dict):
+        raise ValueError("Input should be a valid dictionary.")
+    return value
+
+
+# Context, option, detail and trace payloads are passed through untouched, so
+# they are typed ``Any`` and pydantic-core never walks their nested values. The
+# JSON schema still documents the expected shape; inbound objects only get a
+# shallow type check.
+JsonObject = Annotated[Any, WithJsonSchema({"type": "object", "additionalProperties": True})]
+InboundJsonObject = Annotated[JsonObject, AfterValidator(_require_object)]
+JsonObjectList = Annotated[
+    Any,
+    WithJsonSchema({"type": "array", "items": {"type": "object", "additionalProperties": True}}),
+]
 
 
 # --------------------------------------------------------------------------- #
@@ -13,19 +66,23 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator
 # --------------------------------------------------------------------------- #
 
 
+# Trimming and the minimum length are enforced inside pydantic-core, so report
+# validation never calls back into Python.
+ReportText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=50)]
+
+
 class ProcessReportRequest(BaseModel):
     """Inbound payload for processing a single radiology report."""
 
-    report_text: str = Field(
+    report_text: ReportText = Field(
         ...,
-        min_length=50,
-        description="Radiology report text to analyse.",
+        description="Radiology report text to analyse (at least 50 characters after trimming).",
     )
     patient_id: Optional[str] = Field(
         default=None,
         description="Patient MRN or identifier.",
     )
-    patient_context: Optional[Dict[str, Any]] = Field(
+    patient_context: Optional[InboundJsonObject] = Field(
         default=None,
         description="Additional context (age, risk_factors, smoking_history, etc.).",
     )
@@ -33,37 +90,11 @@ class ProcessReportRequest(BaseModel):
         default=None,
         description="Identifier for the submitted report.",
     )
-    options: Optional[Dict[str, Any]] = Field(
+    options: Optional[InboundJsonObject] = Field(
         default=None,
-        description="Optional execution flags (auto_create_tasks, trace_depth, etc.).",
-    )
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "report_text": (
-                    "FINDINGS: 3mm ground-glass opacity in the right upper lobe. "
-                    "No pleural effusion. IMPRESSION: Indeterminate pulmonary "
-                    "nodule requires interval follow-up."
-                ),
-                "patient_id": "MRN123456",
-                "patient_context": {"age": 65, "smoking_history": "40 pack-years"},
-                "report_id": "RPT-2024-10-001",
-                "options": {"auto_create_tasks": True},
-            }
-        }
+        description="Optional execution flags (auto_create_tasks, include_trace, etc.).",
     )
 
-    @field_validator("report_text")
-    @classmethod
-    def _validate_report_text(cls, value: str) -> str:
-        """Enforce a minimum length after trimming whitespace."""
-
-        normalized = value.strip()
-        if len(normalized) < 50:
-            raise ValueError("report_text must contain at least 50 characters of content.")
-        return normalized
-
 
 class BatchProcessRequest(BaseModel):
     """Inbound payload for processing a batch of reports."""
@@ -75,24 +106,6 @@ class BatchProcessRequest(BaseModel):
         description="Collection of reports to process (max 10).",
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "reports": [
-                    {
-                        "report_text": (
-                            "FINDINGS: New 8mm part-solid nodule in LLL. "
-                            "IMPRESSION: Recommend 3 month follow-up CT."
-                        ),
-                        "patient_id": "MRN987654",
-                        "patient_context": {"age": 58, "copd": True},
-                        "report_id": "RPT-2024-10-010",
-                    }
-                ]
-            }
-        }
-    )
-
 
 # --------------------------------------------------------------------------- #
 # Response models
@@ -104,113 +117,69 @@ ProcessingStatus = Literal["success", "no_findings", "requires_review", "error"]
 UrgencyLevel = Literal["routine", "priority", "urgent", "stat"]
 
 
-class FindingResponse(BaseModel):
-    """Structured representation of an identified finding."""
-
-    finding_id: str = Field(..., description="Unique identifier for the finding.")
-    type: str = Field(..., description="Finding category (e.g., nodule, effusion).")
-    size_mm: Optional[float] = Field(
-        default=None,
-        ge=0,
-        description="Measured size in millimetres (if applicable).",
-    )
-    location: str = Field(..., description="Anatomical location of the finding.")
-    characteristics: List[str] = Field(
-        default_factory=list,
-        description="Relevant attributes (spiculated, ground-glass, etc.).",
-    )
-    confidence: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Model confidence score between 0 and 1.",
-    )
+# The nested response payloads are TypedDicts: routes build them from trusted
+# agent output, and pydantic-core validates plain dicts without allocating a
+# model instance per item.
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "finding_id": "finding-001",
-                "type": "pulmonary_nodule",
-                "size_mm": 6.5,
-                "location": "Right upper lobe",
-                "characteristics": ["ground-glass", "part-solid"],
-                "confidence": 0.92,
-            }
-        }
-    )
 
+def _validate_future_date(value: date) -> date:
+    """Ensure scheduled dates are in the future."""
 
-class RecommendationResponse(BaseModel):
-    """Recommendation derived from guidelines and reasoning."""
+    if value <= _today():
+        raise ValueError("scheduled_date must be in the future.")
+    return value
 
-    recommendation_id: str = Field(..., description="Unique identifier for the recommendation.")
-    follow_up_type: str = Field(..., description="Recommended follow-up procedure.")
-    timeframe_months: Optional[int] = Field(
-        default=None,
-        ge=0,
-        description="Recommended follow-up window in months.",
-    )
-    urgency: UrgencyLevel = Field(
-        ...,
-        description="Clinical urgency for the follow-up action.",
-    )
-    reasoning: str = Field(..., description="Summary of the decision rationale.")
-    citation: str = Field(..., description="Supporting guideline citation.")
-    confidence: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Confidence score between 0 and 1.",
-    )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "recommendation_id": "rec-123",
-                "follow_up_type": "Low-dose CT chest",
-                "timeframe_months": 6,
-                "urgency": "priority",
-                "reasoning": "Solid nodule >6mm in high-risk patient warrants 6-month CT.",
-                "citation": "Fleischner Society 2017 - Table 2",
-                "confidence": 0.88,
-            }
-        }
-    )
+class FindingResponse(TypedDict):
+    """Structured representation of an identified finding."""
 
+    finding_id: Annotated[str, Field(description="Unique identifier for the finding.")]
+    type: Annotated[FindingType, Field(description="Finding category (e.g., nodule, mass, opacity).")]
+    size_mm: Annotated[
+        Optional[float],
+        Field(ge=0, description="Measured size in millimetres (if applicable)."),
+    ]
+    location: Annotated[str, Field(description="Anatomical location of the finding.")]
+    characteristics: Annotated[
+        List[Characteristic],
+        Field(description="Relevant attributes (spiculated, ground-glass, etc.)."),
+    ]
+    confidence: Annotated[
+        float,
+        Field(ge=0.0, le=1.0, description="Model confidence score between 0 and 1."),
+    ]
+
+
+class RecommendationResponse(TypedDict):
+    """Recommendation derived from guidelines and reasoning."""
 
-class TaskResponse(BaseModel):
+    recommendation_id: Annotated[str, Field(description="Unique identifier for the recommendation.")]
+    follow_up_type: Annotated[str, Field(description="Recommended follow-up procedure.")]
+    timeframe_months: Annotated[
+        Optional[int],
+        Field(ge=0, description="Recommended follow-up window in months."),
+    ]
+    urgency: Annotated[UrgencyLevel, Field(description="Clinical urgency for the follow-up action.")]
+    reasoning: Annotated[str, Field(description="Summary of the decision rationale.")]
+    citation: Annotated[str, Field(description="Supporting guideline citation.")]
+    confidence: Annotated[
+        float,
+        Field(ge=0.0, le=1.0, description="Confidence score between 0 and 1."),
+    ]
+
+
+class TaskResponse(TypedDict):
     """Details of a follow-up task created in the EHR."""
 
-    task_id: str = Field(..., description="Identifier for the generated task.")
-    procedure: str = Field(..., description="Procedure or order description.")
-    scheduled_date: date = Field(..., description="Planned date for the procedure.")
-    reason: str = Field(..., description="Clinical justification for the task.")
-    order_id: Optional[str] = Field(
-        default=None,
-        description="EHR order identifier if created.",
-    )
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "task_id": "task-789",
-                "procedure": "Low-dose CT chest",
-                "scheduled_date": "2025-03-15",
-                "reason": "6mm part-solid nodule with high-risk features.",
-                "order_id": "RAD-20250101-1234",
-            }
-        }
-    )
-
-    @field_validator("scheduled_date")
-    @classmethod
-    def _validate_future_date(cls, value: date) -> date:
-        """Ensure scheduled dates are in the future."""
-
-        today = date.today()
-        if value <= today:
-            raise ValueError("scheduled_date must be in the future.")
-        return value
+    task_id: Annotated[str, Field(description="Identifier for the generated task.")]
+    procedure: Annotated[str, Field(description="Procedure or order description.")]
+    scheduled_date: Annotated[
+        date,
+        AfterValidator(_validate_future_date),
+        Field(description="Planned date for the procedure."),
+    ]
+    reason: Annotated[str, Field(description="Clinical justification for the task.")]
+    order_id: Annotated[Optional[str], Field(description="EHR order identifier if created.")]
 
 
 class ProcessReportResponse(BaseModel):
@@ -244,52 +213,12 @@ class ProcessReportResponse(BaseModel):
         ...,
         description="Indicates if manual review is recommended.",
     )
-    decision_trace: Optional[List[Dict[str, Any]]] = Field(
+    decision_trace: Optional[JsonObjectList] = Field(
         default=None,
-        description="Detailed reasoning trace emitted by the agent.",
-    )
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "status": "success",
-                "session_id": "session-001",
-                "report_id": "RPT-2024-10-001",
-                "findings": [
-                    {
-                        "finding_id": "finding-001",
-                        "type": "pulmonary_nodule",
-                        "size_mm": 6.5,
-                        "location": "Right upper lobe",
-                        "characteristics": ["ground-glass"],
-                        "confidence": 0.92,
-                    }
-                ],
-                "recommendations": [
-                    {
-                        "recommendation_id": "rec-123",
-                        "follow_up_type": "Low-dose CT chest",
-                        "timeframe_months": 6,
-                        "urgency": "priority",
-                        "reasoning": "Guidelines recommend 6 month follow-up.",
-                        "citation": "Fleischner Society 2017 - Table 2",
-                        "confidence": 0.88,
-                    }
-                ],
-                "tasks": [
-                    {
-                        "task_id": "task-789",
-                        "procedure": "Low-dose CT chest",
-                        "scheduled_date": "2025-03-15",
-                        "reason": "6mm part-solid nodule with high-risk features.",
-                        "order_id": "RAD-20250101-1234",
-                    }
-                ],
-                "processing_time_ms": 742.5,
-                "message": "Follow-up recommended.",
-                "requires_human_review": False,
-            }
-        }
+        description=(
+            "Detailed reasoning trace emitted by the agent; only included when "
+            "options.include_trace is set."
+        ),
     )
 
 
@@ -298,26 +227,15 @@ class ErrorResponse(BaseModel):
 
     error_code: str = Field(..., description="Machine-readable error identifier.")
     message: str = Field(..., description="Human-readable error description.")
-    details: Optional[Dict[str, Any]] = Field(
+    details: Optional[JsonObject] = Field(
         default=None,
         description="Optional object with additional error details.",
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=_utcnow,
         description="Timestamp when the error occurred.",
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "error_code": "VALIDATION_ERROR",
-                "message": "report_text must contain at least 50 characters of content.",
-                "details": {"field": "report_text"},
-                "timestamp": "2025-01-05T12:00:00Z",
-            }
-        }
-    )
-
 
 class HealthResponse(BaseModel):
     """Response payload for service health checks."""
@@ -329,22 +247,6 @@ class HealthResponse(BaseModel):
     )
     version: str = Field(..., description="Application version string.")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=_utcnow,
         description="Timestamp of the health check.",
     )
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "status": "healthy",
-                "services": {
-                    "llm": "healthy",
-                    "embeddings": "healthy",
-                    "vector_store": "degraded",
-                    "ehr": "healthy",
-                },
-                "version": "1.0.0",
-                "timestamp": "2025-01-05T12:00:00Z",
-            }
-        }
-    )
@@ -0,0 +1,20 @@
+"""Warm the API's schema caches before the server starts serving requests.
+
+Pydantic compiles core schemas and validators when model classes are defined,
+so importing the app is enough to build them. The OpenAPI document is only
+generated on the first ``/openapi.json`` request; building it here moves that
+cost to startup. Under a pre-fork server (for example ``gunicorn --preload``)
+the work happens once in the master, and ``gc.freeze`` keeps the collector in
+forked workers from touching, and therefore copying, those shared pages.
+"""
+
+from __future__ import annotations
+
+import gc
+
+from src.api.app import app
+
+app.openapi()
+gc.freeze()
+
+__all__ = ["app"]
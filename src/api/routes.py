@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import nullcontext
 from datetime import date, timedelta
 from threading import Lock
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 
@@ -25,13 +28,24 @@ from src.api.models import (
     TaskResponse,
 )
 from src.api.models import FindingResponse, HealthStatus
-from src.utils.logger import clear_correlation_id, get_logger, set_correlation_id
+from src.api.vocab import CHARACTERISTICS, FINDING_TYPES
+from src.utils.logger import clear_correlation_id, get_logger, new_correlation_id, set_correlation_id
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 
 logger = get_logger("audra.api.routes")
 
+# FastAPI has already turned the response model into JSON-compatible data by the
+# time the response class renders it; orjson does that final encoding faster.
+DefaultResponse = ORJSONResponse if orjson is not None else JSONResponse
+
 router = APIRouter(
     tags=["Reports", "Health", "Metrics"],
+    default_response_class=DefaultResponse,
     responses={status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse}},
 )
 
@@ -105,6 +119,12 @@ def get_agent(request: Request) -> AuDRAAgent:
     return agent
 
 
+def get_agent_slots(request: Request) -> Optional[asyncio.Semaphore]:
+    """Return the semaphore capping concurrent agent runs, if the application set one."""
+
+    return getattr(request.app.state, "agent_slots", None)
+
+
 # --------------------------------------------------------------------------- #
 # Utility functions
 # --------------------------------------------------------------------------- #
@@ -123,12 +143,13 @@ def _build_finding(payload: Dict[str, Any]) -> FindingResponse:
     characteristics = payload.get("characteristics") or []
     if not isinstance(characteristics, list):
         characteristics = [str(characteristics)]
+    finding_type = str(payload.get("type") or payload.get("finding_type") or "unknown")
     return FindingResponse(
         finding_id=str(finding_id),
-        type=str(payload.get("type") or payload.get("finding_type") or "unknown"),
+        type=finding_type if finding_type in FINDING_TYPES else "unknown",
         size_mm=float(payload["size_mm"]) if payload.get("size_mm") is not None else None,
         location=str(payload.get("location") or payload.get("site") or "unspecified"),
-        characteristics=[str(item) for item in characteristics],
+        characteristics=[str(item) for item in characteristics if str(item) in CHARACTERISTICS],
         confidence=_clamp_confidence(payload.get("confidence"), default=0.0),
     )
 
@@ -158,9 +179,9 @@ def _build_tasks(order_ids: List[str], recommendations: List[RecommendationRespo
     today = date.today()
     for idx, order_id in enumerate(order_ids):
         recommendation = recommendations[idx] if idx < len(recommendations) else None
-        procedure = recommendation.follow_up_type if recommendation else "Follow-up procedure"
-        reason = recommendation.reasoning if recommendation else "Automated recommendation generated by AuDRA."
-        timeframe_months = recommendation.timeframe_months if recommendation else None
+        procedure = recommendation["follow_up_type"] if recommendation else "Follow-up procedure"
+        reason = recommendation["reasoning"] if recommendation else "Automated recommendation generated by AuDRA."
+        timeframe_months = recommendation["timeframe_months"] if recommendation else None
         days_in_future = 30
         if isinstance(timeframe_months, int) and timeframe_months > 0:
             days_in_future = max(timeframe_months * 30, 1)
@@ -192,6 +213,35 @@ def _requires_human_review(
     return False
 
 
+# ProcessReportResponse is only ever built from trusted agent output and FastAPI
+# validates it once more against ``response_model`` before serialising, so the
+# constructor-time validation walk is skipped unless the model gains validators.
+_RESPONSE_HAS_VALIDATORS = bool(
+    ProcessReportResponse.__pydantic_decorators__.field_validators
+    or ProcessReportResponse.__pydantic_decorators__.model_validators
+)
+
+
+def _construct_response(**fields: Any) -> ProcessReportResponse:
+    """Build a response from already-normalised builder output."""
+
+    if _RESPONSE_HAS_VALIDATORS:
+        return ProcessReportResponse.model_validate(fields)
+    return ProcessReportResponse.model_construct(**fields)
+
+
+def _wants_trace(request_payload: ProcessReportRequest) -> bool:
+    """Return whether the caller asked for the decision trace inline.
+
+    Traces can dwarf the rest of the response, so they are omitted unless
+    ``options.include_trace`` is set; ``GET /session/{session_id}/trace`` serves
+    them on demand.
+    """
+
+    options = request_payload.options
+    return bool(options and options.get("include_trace"))
+
+
 def _build_response(result: ProcessingResult, request_payload: ProcessReportRequest) -> ProcessReportResponse:
     state = result.state
     if state is None:
@@ -202,7 +252,7 @@ def _build_response(result: ProcessingResult, request_payload: ProcessReportRequ
     recommendations = [_build_recommendation(item) for item in raw_recommendations]
     tasks = _build_tasks(result.tasks, recommendations)
 
-    response = ProcessReportResponse(
+    response = _construct_response(
         status=result.status,
         session_id=state.session_id,
         report_id=state.report_id,
@@ -212,7 +262,11 @@ def _build_response(result: ProcessingResult, request_payload: ProcessReportRequ
         processing_time_ms=result.processing_time_ms,
         message=result.message,
         requires_human_review=_requires_human_review(result.status, raw_recommendations),
-        decision_trace=result.decision_trace or (state.decision_trace or None),
+        decision_trace=(
+            result.decision_trace or state.decision_trace or None
+            if _wants_trace(request_payload)
+            else None
+        ),
     )
     return response
 
@@ -232,8 +286,8 @@ def _build_response_from_state(state: AgentState) -> ProcessReportResponse:
     }
     status_text = state.status if state.status in {"success", "no_findings", "requires_review", "error"} else status_map.get(state.status, "requires_review")
 
-    return ProcessReportResponse(
-        status=status_text,  # type: ignore[arg-type]
+    return _construct_response(
+        status=status_text,
         session_id=state.session_id,
         report_id=state.report_id,
         findings=findings,
@@ -242,14 +296,30 @@ def _build_response_from_state(state: AgentState) -> ProcessReportResponse:
         processing_time_ms=0.0,
         message=state.error,
         requires_human_review=_requires_human_review(status_text, state.recommendations),
-        decision_trace=state.decision_trace or None,
     )
 
 
+async def _process_report(
+    agent: AuDRAAgent,
+    payload: ProcessReportRequest,
+    agent_slots: Optional[asyncio.Semaphore] = None,
+) -> ProcessingResult:
+    """Run the agent in a worker thread, holding an agent slot when one is configured."""
+
+    async with agent_slots if agent_slots is not None else nullcontext():
+        return await asyncio.to_thread(
+            agent.process_report,
+            payload.report_text,
+            patient_context=payload.patient_context,
+            report_id=payload.report_id,
+        )
+
+
 async def _run_agent(
     agent: AuDRAAgent,
     payload: ProcessReportRequest,
     correlation_id: str,
+    agent_slots: Optional[asyncio.Semaphore] = None,
 ) -> ProcessReportResponse:
     set_correlation_id(correlation_id)
     logger.info(
@@ -264,12 +334,7 @@ async def _run_agent(
     )
 
     try:
-        result = await asyncio.to_thread(
-            agent.process_report,
-            payload.report_text,
-            patient_context=payload.patient_context,
-            report_id=payload.report_id,
-        )
+        result = await _process_report(agent, payload, agent_slots)
         response = _build_response(result, payload)
         logger.info(
             "Report processed.",
@@ -300,6 +365,58 @@ async def _run_agent(
         clear_correlation_id()
 
 
+# --------------------------------------------------------------------------- #
+# Request body parsing
+# --------------------------------------------------------------------------- #
+
+
+# Built once per process; validate_json runs pydantic-core directly on the raw
+# body instead of FastAPI's json.loads() followed by model validation.
+_REQ_ADAPTER = TypeAdapter(ProcessReportRequest)
+_BATCH_ADAPTER = TypeAdapter(BatchProcessRequest)
+
+
+async def _validate_body(request: Request, adapter: TypeAdapter[Any]) -> Any:
+    body = await request.body()
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from exc
+
+
+async def _process_report_payload(request: Request) -> ProcessReportRequest:
+    return await _validate_body(request, _REQ_ADAPTER)
+
+
+async def _batch_process_payload(request: Request) -> BatchProcessRequest:
+    return await _validate_body(request, _BATCH_ADAPTER)
+
+
+# Models referenced by ``_json_request_body``; ``create_app`` adds their schemas
+# to the OpenAPI components when the document is first generated.
+REQUEST_BODY_MODELS: List[type[BaseModel]] = []
+
+
+def _json_request_body(model: type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI requestBody for routes that validate the raw body themselves."""
+
+    REQUEST_BODY_MODELS.append(model)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"}
+                }
+            },
+        }
+    }
+
+
 # --------------------------------------------------------------------------- #
 # Routes
 # --------------------------------------------------------------------------- #
@@ -313,17 +430,18 @@ async def _run_agent(
         "Process a single radiology report to extract findings, match guidelines, "
         "generate recommendations, and optionally create follow-up tasks."
     ),
+    openapi_extra=_json_request_body(ProcessReportRequest),
 )
 @limiter.limit("10/minute")
 async def process_report_endpoint(
-    raw_request: Request,
-    request: ProcessReportRequest,
+    request: Request,
+    payload: ProcessReportRequest = Depends(_process_report_payload),
     agent: AuDRAAgent = Depends(get_agent),
     correlation_id: Optional[str] = Header(None, alias="X-Correlation-ID"),
 ) -> ProcessReportResponse:
-    correlation = correlation_id or str(uuid4())
-    raw_request.state.correlation_id = correlation
-    return await _run_agent(agent, request, correlation)
+    correlation = correlation_id or new_correlation_id()
+    request.state.correlation_id = correlation
+    return await _run_agent(agent, payload, correlation, get_agent_slots(request))
 
 
 @router.post(
@@ -331,15 +449,19 @@ async def process_report_endpoint(
     response_model=List[ProcessReportResponse],
     summary="Process multiple reports in batch.",
     description="Process up to 10 reports concurrently and return the results.",
+    openapi_extra=_json_request_body(BatchProcessRequest),
 )
 async def batch_process_endpoint(
-    request: BatchProcessRequest,
+    request: Request,
+    payload: BatchProcessRequest = Depends(_batch_process_payload),
     agent: AuDRAAgent = Depends(get_agent),
 ) -> List[ProcessReportResponse]:
+    agent_slots = get_agent_slots(request)
+
     async def _process_single(report_request: ProcessReportRequest) -> ProcessReportResponse:
-        correlation = str(uuid4())
+        correlation = new_correlation_id()
         try:
-            return await _run_agent(agent, report_request, correlation)
+            return await _run_agent(agent, report_request, correlation, agent_slots)
         except Exception as exc:
             logger.error(
                 "Failed to process report within batch.",
@@ -352,7 +474,7 @@ async def batch_process_endpoint(
             )
             raise
 
-    tasks = [_process_single(report) for report in request.reports]
+    tasks = [_process_single(report) for report in payload.reports]
     return await asyncio.gather(*tasks)
 
 
@@ -420,6 +542,40 @@ async def get_session_endpoint(session_id: str) -> ProcessReportResponse:
     return response
 
 
+@router.get(
+    "/session/{session_id}/trace",
+    summary="Retrieve a session's decision trace.",
+    description="Return the agent decision trace recorded for a previously processed report.",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"type": "object", "additionalProperties": True},
+                    }
+                }
+            }
+        }
+    },
+)
+async def get_session_trace_endpoint(session_id: str) -> JSONResponse:
+    try:
+        state = StateManager.load_state(session_id)
+    except KeyError as exc:
+        logger.warning(
+            "Requested session not found.",
+            extra={"context": {"session_id": session_id}},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+
+    # The trace is returned as stored, without a response-model walk.
+    return DefaultResponse(content=state.decision_trace)
+
+
 @router.get(
     "/metrics",
     summary="Retrieve processing metrics.",
@@ -452,7 +608,7 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONRe
         message="Too many requests. Please slow down.",
         details={"limit": str(exc.detail)},
     )
-    return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=response.model_dump())
+    return DefaultResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=response.model_dump(mode="json"))
 
 
 async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
@@ -464,7 +620,7 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         error_code="VALIDATION_ERROR",
         message=str(exc),
     )
-    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=response.model_dump())
+    return DefaultResponse(status_code=status.HTTP_400_BAD_REQUEST, content=response.model_dump(mode="json"))
 
 
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -476,7 +632,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         error_code="INTERNAL_ERROR",
         message="An unexpected error occurred.",
     )
-    return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=response.model_dump())
+    return DefaultResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=response.model_dump(mode="json"))
 
 
 def register_exception_handlers(app: FastAPI) -> None:
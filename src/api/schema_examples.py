@@ -0,0 +1,126 @@
+"""OpenAPI examples for the AuDRA API models.
+
+Examples are attached to the generated component schemas only when the OpenAPI
+document is first built, keeping them out of model construction on every
+worker import.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "ProcessReportRequest": {
+        "report_text": (
+            "FINDINGS: 3mm ground-glass opacity in the right upper lobe. "
+            "No pleural effusion. IMPRESSION: Indeterminate pulmonary "
+            "nodule requires interval follow-up."
+        ),
+        "patient_id": "MRN123456",
+        "patient_context": {"age": 65, "smoking_history": "40 pack-years"},
+        "report_id": "RPT-2024-10-001",
+        "options": {"auto_create_tasks": True},
+    },
+    "BatchProcessRequest": {
+        "reports": [
+            {
+                "report_text": (
+                    "FINDINGS: New 8mm part-solid nodule in LLL. "
+                    "IMPRESSION: Recommend 3 month follow-up CT."
+                ),
+                "patient_id": "MRN987654",
+                "patient_context": {"age": 58, "copd": True},
+                "report_id": "RPT-2024-10-010",
+            }
+        ]
+    },
+    "FindingResponse": {
+        "finding_id": "finding-001",
+        "type": "pulmonary_nodule",
+        "size_mm": 6.5,
+        "location": "Right upper lobe",
+        "characteristics": ["ground-glass", "part-solid"],
+        "confidence": 0.92,
+    },
+    "RecommendationResponse": {
+        "recommendation_id": "rec-123",
+        "follow_up_type": "Low-dose CT chest",
+        "timeframe_months": 6,
+        "urgency": "priority",
+        "reasoning": "Solid nodule >6mm in high-risk patient warrants 6-month CT.",
+        "citation": "Fleischner Society 2017 - Table 2",
+        "confidence": 0.88,
+    },
+    "TaskResponse": {
+        "task_id": "task-789",
+        "procedure": "Low-dose CT chest",
+        "scheduled_date": "2025-03-15",
+        "reason": "6mm part-solid nodule with high-risk features.",
+        "order_id": "RAD-20250101-1234",
+    },
+    "ProcessReportResponse": {
+        "status": "success",
+        "session_id": "session-001",
+        "report_id": "RPT-2024-10-001",
+        "findings": [
+            {
+                "finding_id": "finding-001",
+                "type": "pulmonary_nodule",
+                "size_mm": 6.5,
+                "location": "Right upper lobe",
+                "characteristics": ["ground-glass"],
+                "confidence": 0.92,
+            }
+        ],
+        "recommendations": [
+            {
+                "recommendation_id": "rec-123",
+                "follow_up_type": "Low-dose CT chest",
+                "timeframe_months": 6,
+                "urgency": "priority",
+                "reasoning": "Guidelines recommend 6 month follow-up.",
+                "citation": "Fleischner Society 2017 - Table 2",
+                "confidence": 0.88,
+            }
+        ],
+        "tasks": [
+            {
+                "task_id": "task-789",
+                "procedure": "Low-dose CT chest",
+                "scheduled_date": "2025-03-15",
+                "reason": "6mm part-solid nodule with high-risk features.",
+                "order_id": "RAD-20250101-1234",
+            }
+        ],
+        "processing_time_ms": 742.5,
+        "message": "Follow-up recommended.",
+        "requires_human_review": False,
+    },
+    "ErrorResponse": {
+        "error_code": "VALIDATION_ERROR",
+        "message": "report_text must contain at least 50 characters of content.",
+        "details": {"field": "report_text"},
+        "timestamp": "2025-01-05T12:00:00Z",
+    },
+    "HealthResponse": {
+        "status": "healthy",
+        "services": {
+            "llm": "healthy",
+            "embeddings": "healthy",
+            "vector_store": "degraded",
+            "ehr": "healthy",
+        },
+        "version": "1.0.0",
+        "timestamp": "2025-01-05T12:00:00Z",
+    },
+}
+
+
+def apply_schema_examples(components: Dict[str, Dict[str, Any]]) -> None:
+    """Attach :data:`EXAMPLES` to the matching OpenAPI component schemas."""
+
+    for name, example in EXAMPLES.items():
+        schema = components.get(name)
+        if schema is not None:
+            schema.setdefault("example", example)
@@ -0,0 +1,35 @@
+"""Closed vocabularies shared by the AuDRA API response models."""
+
+from __future__ import annotations
+
+from typing import FrozenSet, Literal, get_args
+
+
+# Finding types emitted by ReportParser.classify_finding_type plus the
+# guideline-style labels used by the seed data; anything else maps to "unknown".
+FindingType = Literal[
+    "nodule",
+    "mass",
+    "lesion",
+    "opacity",
+    "pulmonary_nodule",
+    "hepatic_lesion",
+    "unknown",
+]
+
+# Labels produced by src.parsers.report_parser.CHARACTERISTIC_PATTERNS.
+Characteristic = Literal[
+    "ground-glass",
+    "part-solid",
+    "solid",
+    "subsolid",
+    "spiculated",
+    "smooth",
+    "calcified",
+    "irregular",
+    "lobulated",
+    "consolidation",
+]
+
+FINDING_TYPES: FrozenSet[str] = frozenset(get_args(FindingType))
+CHARACTERISTICS: FrozenSet[str] = frozenset(get_args(Characteristic))
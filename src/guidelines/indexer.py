@@ -2,17 +2,25 @@ from __future__ import annotations
 
 """Utilities for loading, chunking, and indexing medical guideline content."""
 
+import asyncio
 import re
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from src.guidelines.parallel_indexer import parallel_index
 from src.services.nim_embeddings import EmbeddingClient
-from src.services.vector_store import VectorStore
+from src.services.vector_store import BULK_MAX_CHUNK_BYTES, VectorStore
 from src.utils.logger import get_logger
 
 
+# Below this much markdown, in-process chunking (roughly 14 MB/s) beats the
+# cost of starting worker processes and pickling chunks back.
+POOL_MIN_BYTES = 8 * 1024 * 1024
+
+
 @dataclass
 class GuidelineChunk:
     """A structured slice of a guideline document suitable for retrieval."""
@@ -42,16 +50,23 @@ class GuidelineIndexer:
         (re.compile(r">\s*(\d+(?:\.\d+)?)\s*mm", re.IGNORECASE), "gt"),
         (re.compile(r"(\d+(?:\.\d+)?)\s*mm", re.IGNORECASE), "single"),
     )
-    MODALITY_KEYWORDS: Sequence[Tuple[re.Pattern[str], str]] = (
-        (re.compile(r"\bpet[-/]?ct\b", re.IGNORECASE), "PET-CT"),
-        (re.compile(r"\bpet\b", re.IGNORECASE), "PET"),
-        (re.compile(r"\bmri\b", re.IGNORECASE), "MRI"),
-        (re.compile(r"\bldct\b", re.IGNORECASE), "CT"),
-        (re.compile(r"\bct\b", re.IGNORECASE), "CT"),
-        (re.compile(r"\bultrasound\b", re.IGNORECASE), "Ultrasound"),
-        (re.compile(r"\bceus\b", re.IGNORECASE), "CEUS"),
-        (re.compile(r"\bbiopsy\b", re.IGNORECASE), "Biopsy"),
+    # Modality keywords in priority order. A single alternation finds every
+    # mention in one pass; the highest-priority keyword present wins.
+    MODALITY_KEYWORDS: Sequence[Tuple[str, str]] = (
+        ("petct", "PET-CT"),
+        ("pet", "PET"),
+        ("mri", "MRI"),
+        ("ldct", "CT"),
+        ("ct", "CT"),
+        ("ultrasound", "Ultrasound"),
+        ("ceus", "CEUS"),
+        ("biopsy", "Biopsy"),
+    )
+    MODALITY_PATTERN = re.compile(
+        r"\b(?:pet[-/]?ct|pet|mri|ldct|ct|ultrasound|ceus|biopsy)\b",
+        re.IGNORECASE,
     )
+    _MODALITY_RANKS: Dict[str, int] = {keyword: rank for rank, (keyword, _) in enumerate(MODALITY_KEYWORDS)}
 
     MIN_WORDS = 100
     TARGET_MIN_WORDS = 200
@@ -59,8 +74,11 @@ class GuidelineIndexer:
     MAX_WORDS = 500
     OPEN_ENDED_MAX = 999.0
 
-    def __init__(self) -> None:
+    def __init__(self, embed_micro_batch_size: int = 32) -> None:
+        if embed_micro_batch_size <= 0:
+            raise ValueError("embed_micro_batch_size must be positive.")
         self._logger = get_logger("audra.guidelines.indexer")
+        self.embed_micro_batch_size = embed_micro_batch_size
 
     # ------------------------------------------------------------------ #
 
@@ -156,9 +174,25 @@ class GuidelineIndexer:
         embedding_client: EmbeddingClient,
         vector_store: VectorStore,
         *,
-        batch_size: int = 50,
+        batch_size: int = 32,
+        bulk_size_bytes: int = BULK_MAX_CHUNK_BYTES,
+        pipelined: bool = False,
+        workers: Optional[int] = None,
+        upload_concurrency: int = 2,
     ) -> None:
-        """Load, chunk, embed, and index all markdown guidelines."""
+        """Load, chunk, embed, and index all markdown guidelines.
+
+        Loading and chunking run in this process unless ``workers`` is above one
+        and the guidelines total at least ``POOL_MIN_BYTES``, in which case they
+        are spread across that many processes; embedding and indexing always stay
+        in this process. Documents from every guideline are accumulated and written
+        with a single bulk call so the vector store sees one ``_bulk`` request
+        per ``batch_size`` documents rather than one round trip per guideline,
+        with ``upload_concurrency`` bulk requests in flight. Batches of about 32
+        documents with two concurrent uploads are a good default; larger values
+        mostly add throttling. With ``pipelined=True`` embedding and bulk writes
+        overlap via :func:`parallel_index` instead.
+        """
 
         directory = Path(guidelines_dir)
         if not directory.exists():
@@ -172,18 +206,22 @@ class GuidelineIndexer:
             )
             return
 
-        total_chunks = 0
-        total_words = 0
         guideline_stats: List[Dict[str, object]] = []
+        pending_chunks: List[GuidelineChunk] = []
+
+        paths = [str(file_path) for file_path in markdown_files]
+        if (
+            workers is not None
+            and workers > 1
+            and len(paths) > 1
+            and sum(file_path.stat().st_size for file_path in markdown_files) >= POOL_MIN_BYTES
+        ):
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+                loaded = list(executor.map(_load_and_chunk, paths, chunksize=2))
+        else:
+            loaded = [_load_and_chunk(path) for path in paths]
 
-        for file_path in markdown_files:
-            metadata = self.load_guideline(str(file_path))
-            title = metadata["title"]
-            citation = metadata.get("citation", "")
-            chunks = self.chunk_guideline(metadata["content"], title)
-            for chunk in chunks:
-                chunk.citation = citation
-
+        for file_path, (title, chunks) in zip(markdown_files, loaded):
             if not chunks:
                 self._logger.warning(
                     "No chunks created from guideline.",
@@ -192,52 +230,79 @@ class GuidelineIndexer:
                 continue
 
             self._logger.info(f"Indexing {title}... {len(chunks)} chunks")
+            pending_chunks.extend(chunks)
+            guideline_stats.append({"title": title, "chunks": len(chunks)})
 
-            texts = [chunk.text for chunk in chunks]
-            embeddings = embedding_client.embed_batch(texts)
-
-            documents = []
-            for chunk, embedding in zip(chunks, embeddings):
-                total_chunks += 1
-                total_words += self._word_count(chunk.text)
-                metadata_payload: Dict[str, object] = {
-                    "source": chunk.source,
-                    "category": chunk.category,
-                    "citation": chunk.citation,
-                    "recommendation": chunk.recommendation,
-                }
-                if chunk.size_min_mm is not None:
-                    metadata_payload["size_min_mm"] = float(chunk.size_min_mm)
-                if chunk.size_max_mm is not None:
-                    metadata_payload["size_max_mm"] = float(chunk.size_max_mm)
-                if chunk.risk_level:
-                    metadata_payload["risk_level"] = chunk.risk_level
-                if chunk.modality:
-                    metadata_payload["modality"] = chunk.modality
-
-                documents.append(
-                    {
-                        "id": chunk.chunk_id,
-                        "text": chunk.text,
-                        "embedding": embedding,
-                        "metadata": metadata_payload,
-                    }
+        if not pending_chunks:
+            return
+
+        if pipelined:
+            asyncio.run(
+                parallel_index(
+                    pending_chunks,
+                    embedding_client,
+                    vector_store,
+                    self.build_document,
+                    batch_size=batch_size,
+                    bulk_size_bytes=bulk_size_bytes,
+                    embed_batch_size=self.embed_micro_batch_size,
+                    upload_concurrency=upload_concurrency,
                 )
+            )
+        else:
+            # Identical chunk texts (e.g. shared boilerplate sections) are embedded once.
+            unique_texts = list(dict.fromkeys(chunk.text for chunk in pending_chunks))
+            embeddings = dict(
+                zip(
+                    unique_texts,
+                    embedding_client.embed_batch(unique_texts, batch_size=self.embed_micro_batch_size),
+                )
+            )
+            documents = [self.build_document(chunk, embeddings[chunk.text]) for chunk in pending_chunks]
+            vector_store.index_batch(
+                documents,
+                batch_size=batch_size,
+                max_chunk_bytes=bulk_size_bytes,
+                concurrency=upload_concurrency,
+            )
 
-            vector_store.index_batch(documents, batch_size=batch_size)
-            guideline_stats.append({"title": title, "chunks": len(chunks)})
+        total_chunks = len(pending_chunks)
+        total_words = sum(self._word_count(chunk.text) for chunk in pending_chunks)
+        summary_context = {
+            "guidelines_indexed": len(guideline_stats),
+            "chunks_indexed": total_chunks,
+            "avg_chunk_words": round(total_words / total_chunks, 1),
+        }
+        self._logger.info(
+            "Guideline indexing complete.",
+            extra={"context": summary_context},
+        )
 
-        if total_chunks:
-            avg_words = total_words / total_chunks
-            summary_context = {
-                "guidelines_indexed": len(guideline_stats),
-                "chunks_indexed": total_chunks,
-                "avg_chunk_words": round(avg_words, 1),
-            }
-            self._logger.info(
-                "Guideline indexing complete.",
-                extra={"context": summary_context},
-            )
+    @staticmethod
+    def build_document(chunk: GuidelineChunk, embedding: List[float]) -> Dict[str, object]:
+        """Return the vector store document payload for an embedded chunk."""
+
+        metadata_payload: Dict[str, object] = {
+            "source": chunk.source,
+            "category": chunk.category,
+            "citation": chunk.citation,
+            "recommendation": chunk.recommendation,
+        }
+        if chunk.size_min_mm is not None:
+            metadata_payload["size_min_mm"] = float(chunk.size_min_mm)
+        if chunk.size_max_mm is not None:
+            metadata_payload["size_max_mm"] = float(chunk.size_max_mm)
+        if chunk.risk_level:
+            metadata_payload["risk_level"] = chunk.risk_level
+        if chunk.modality:
+            metadata_payload["modality"] = chunk.modality
+
+        return {
+            "id": chunk.chunk_id,
+            "text": chunk.text,
+            "embedding": embedding,
+            "metadata": metadata_payload,
+        }
 
     # ------------------------------------------------------------------ #
     # Internal helpers
@@ -278,34 +343,42 @@ class GuidelineIndexer:
         if not paragraphs:
             return [body]
 
-        chunks: List[str] = []
+        # Each paragraph is counted once; chunk sizes are running sums of those
+        # counts rather than recounts of the joined candidate text.
+        chunks: List[Tuple[str, int]] = []
         current: List[str] = []
+        current_words = 0
         for paragraph in paragraphs:
-            candidate = "\n\n".join([*current, paragraph]).strip()
-            if current and self._word_count(candidate) > self.MAX_WORDS:
-                chunks.append("\n\n".join(current).strip())
+            paragraph_words = self._word_count(paragraph)
+            if current and current_words + paragraph_words > self.MAX_WORDS:
+                chunks.append(("\n\n".join(current), current_words))
                 current = [paragraph]
+                current_words = paragraph_words
             else:
                 current.append(paragraph)
+                current_words += paragraph_words
 
         if current:
-            chunks.append("\n\n".join(current).strip())
+            chunks.append(("\n\n".join(current), current_words))
 
         # Further split any oversized chunk using sentence boundaries.
         normalized: List[str] = []
-        for chunk in chunks:
-            if self._word_count(chunk) <= self.MAX_WORDS:
+        for chunk, chunk_words in chunks:
+            if chunk_words <= self.MAX_WORDS:
                 normalized.append(chunk)
                 continue
             sentences = self.SENTENCE_SPLIT_PATTERN.split(chunk)
             sentence_buffer: List[str] = []
+            buffer_words = 0
             for sentence in sentences:
-                candidate = " ".join([*sentence_buffer, sentence]).strip()
-                if sentence_buffer and self._word_count(candidate) > self.MAX_WORDS:
+                sentence_words = self._word_count(sentence)
+                if sentence_buffer and buffer_words + sentence_words > self.MAX_WORDS:
                     normalized.append(" ".join(sentence_buffer).strip())
                     sentence_buffer = [sentence]
+                    buffer_words = sentence_words
                 else:
                     sentence_buffer.append(sentence)
+                    buffer_words += sentence_words
             if sentence_buffer:
                 normalized.append(" ".join(sentence_buffer).strip())
 
@@ -318,12 +391,13 @@ class GuidelineIndexer:
         for section in sections:
             word_count = int(section.get("word_count", self._word_count(str(section.get("body", "")))))
 
+            # Word counts are additive across the "\n\n" joins, so merged
+            # sections carry a running total instead of re-splitting the body.
             if buffer is not None:
-                buffer_word_count = self._word_count(str(buffer["body"]))
-                if buffer_word_count < self.TARGET_MIN_WORDS:
+                if int(buffer["word_count"]) < self.TARGET_MIN_WORDS:
                     buffer["body"] = f"{buffer['body']}\n\n{section['body']}".strip()
                     buffer["title"] = f"{buffer['title']} | {section['title']}"
-                    buffer["word_count"] = self._word_count(str(buffer["body"]))
+                    buffer["word_count"] = int(buffer["word_count"]) + word_count
                     continue
                 merged.append(buffer)
                 buffer = None
@@ -338,7 +412,7 @@ class GuidelineIndexer:
                 else:
                     buffer["body"] = f"{buffer['body']}\n\n{section['body']}".strip()
                     buffer["title"] = f"{buffer['title']} | {section['title']}"
-                    buffer["word_count"] = self._word_count(str(buffer["body"]))
+                    buffer["word_count"] = int(buffer["word_count"]) + word_count
                 continue
 
             merged.append(
@@ -353,7 +427,7 @@ class GuidelineIndexer:
             if merged:
                 merged[-1]["body"] = f"{merged[-1]['body']}\n\n{buffer['body']}".strip()
                 merged[-1]["title"] = f"{merged[-1]['title']} | {buffer['title']}"
-                merged[-1]["word_count"] = self._word_count(str(merged[-1]["body"]))
+                merged[-1]["word_count"] = int(merged[-1]["word_count"]) + int(buffer["word_count"])
             else:
                 merged.append(buffer)
 
@@ -393,10 +467,15 @@ class GuidelineIndexer:
         return "mixed"
 
     def _infer_modality(self, text: str) -> Optional[str]:
-        for pattern, modality in self.MODALITY_KEYWORDS:
-            if pattern.search(text):
-                return modality
-        return None
+        best: Optional[int] = None
+        for match in self.MODALITY_PATTERN.finditer(text):
+            keyword = match.group().lower().replace("-", "").replace("/", "")
+            rank = self._MODALITY_RANKS[keyword]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        return None if best is None else self.MODALITY_KEYWORDS[best][1]
 
     @staticmethod
     def _word_count(text: str) -> int:
@@ -407,3 +486,16 @@ class GuidelineIndexer:
         cleaned = re.sub(r"\*\*", "", line)
         cleaned = re.sub(r"^Reference[:\s-]*", "", cleaned, flags=re.IGNORECASE).strip()
         return cleaned
+
+
+def _load_and_chunk(file_path: str) -> Tuple[str, List[GuidelineChunk]]:
+    """Load and chunk one guideline file; runs in an indexing worker process."""
+
+    indexer = GuidelineIndexer()
+    metadata = indexer.load_guideline(file_path)
+    title = metadata["title"]
+    citation = metadata.get("citation", "")
+    chunks = indexer.chunk_guideline(metadata["content"], title)
+    for chunk in chunks:
+        chunk.citation = citation
+    return title, chunks
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+"""Overlapped embedding and bulk-write pipeline for guideline indexing."""
+
+import asyncio
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from src.services.nim_embeddings import EmbeddingClient
+from src.services.vector_store import BULK_MAX_CHUNK_BYTES, VectorStore
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from src.guidelines.indexer import GuidelineChunk
+
+
+DocumentBuilder = Callable[["GuidelineChunk", List[float]], Dict[str, object]]
+
+_LOGGER = get_logger("audra.guidelines.parallel_indexer")
+
+
+async def parallel_index(
+    chunks: Sequence["GuidelineChunk"],
+    embedding_client: EmbeddingClient,
+    vector_store: VectorStore,
+    build_document: DocumentBuilder,
+    *,
+    batch_size: int = 50,
+    bulk_size_bytes: int = BULK_MAX_CHUNK_BYTES,
+    embed_batch_size: int = 32,
+    embed_workers: int = 4,
+    max_queue_size: int = 8,
+    upload_concurrency: int = 1,
+) -> int:
+    """Embed and index chunks with overlapping embedding and write stages.
+
+    A producer feeds length-sorted batches of unique chunk texts into a bounded
+    queue consumed by ``embed_workers`` embedding tasks; embedded documents
+    flow through a second bounded queue to a single writer that flushes
+    ``batch_size`` documents per bulk call, with up to ``upload_concurrency``
+    bulk requests in flight. The clients are synchronous, so each call runs in
+    a worker thread. Returns the number of documents written.
+    """
+
+    if embed_batch_size <= 0 or embed_workers <= 0 or max_queue_size <= 0:
+        raise ValueError("embed_batch_size, embed_workers and max_queue_size must be positive.")
+
+    embed_queue: asyncio.Queue[Optional[Sequence[str]]] = asyncio.Queue(
+        maxsize=max_queue_size
+    )
+    write_queue: asyncio.Queue[Optional[List[Dict[str, object]]]] = asyncio.Queue(
+        maxsize=max_queue_size
+    )
+
+    # Identical texts are embedded once, and batching similarly sized texts
+    # keeps padding low on the embedding server.
+    chunks_by_text: Dict[str, List["GuidelineChunk"]] = {}
+    for chunk in chunks:
+        chunks_by_text.setdefault(chunk.text, []).append(chunk)
+    ordered = sorted(chunks_by_text, key=lambda text: len(text.split()))
+
+    async def _produce() -> None:
+        for start in range(0, len(ordered), embed_batch_size):
+            await embed_queue.put(ordered[start : start + embed_batch_size])
+        for _ in range(embed_workers):
+            await embed_queue.put(None)
+
+    async def _embed_worker() -> None:
+        while True:
+            batch = await embed_queue.get()
+            if batch is None:
+                return
+            vectors = await asyncio.to_thread(embedding_client.embed_texts, list(batch))
+            await write_queue.put(
+                [
+                    build_document(chunk, vector)
+                    for text, vector in zip(batch, vectors)
+                    for chunk in chunks_by_text[text]
+                ]
+            )
+
+    async def _embed_stage() -> None:
+        await _run_until_failure([_produce(), *(_embed_worker() for _ in range(embed_workers))])
+        await write_queue.put(None)
+
+    async def _write_stage() -> int:
+        written = 0
+        pending: List[Dict[str, object]] = []
+        while True:
+            documents = await write_queue.get()
+            if documents is not None:
+                pending.extend(documents)
+            if pending and (documents is None or len(pending) >= batch_size):
+                await asyncio.to_thread(
+                    vector_store.index_batch,
+                    pending,
+                    batch_size,
+                    max_chunk_bytes=bulk_size_bytes,
+                    concurrency=upload_concurrency,
+                )
+                written += len(pending)
+                pending = []
+            if documents is None:
+                return written
+
+    _, written = await _run_until_failure([_embed_stage(), _write_stage()])
+    _LOGGER.debug(
+        "Pipelined guideline indexing finished.",
+        extra={"context": {"documents": written, "embed_workers": embed_workers}},
+    )
+    return written
+
+
+async def _run_until_failure(coroutines: Sequence[Awaitable[object]]) -> List[object]:
+    """Run coroutines concurrently, cancelling the rest as soon as one fails."""
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    for task in tasks:
+        if task in done and task.exception() is not None:
+            raise task.exception()  # type: ignore[misc]
+    return [task.result() for task in tasks]
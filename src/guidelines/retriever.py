@@ -3,6 +3,7 @@ from __future__ import annotations
 """Guideline retrieval logic built on top of the vector store."""
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List, Optional, Sequence
 
 from src.guidelines.indexer import GuidelineChunk
@@ -21,6 +22,9 @@ class RetrievedDocument:
     metadata: Dict[str, object]
 
 
+_SCORE = attrgetter("score")
+
+
 class GuidelineRetriever:
     """Surface guideline chunks that align with radiology findings."""
 
@@ -155,37 +159,31 @@ class GuidelineRetriever:
 
         target_size = self._coerce_float(finding.get("size_mm"))
         risk_level = self._normalize_risk(finding.get("risk_level"))
+        coerce_float = self._coerce_float
 
         reranked: List[RetrievedDocument] = []
         for doc in results:
             score = doc.score
             metadata = doc.metadata
 
-            size_min = self._coerce_float(metadata.get("size_min_mm"))
-            size_max = self._coerce_float(metadata.get("size_max_mm"))
-
-            if target_size is not None and size_min is not None and size_max is not None:
-                if size_min <= target_size <= size_max:
-                    score += 2.0
-                else:
-                    distance = min(abs(target_size - size_min), abs(target_size - size_max))
-                    score -= min(distance / 10.0, 1.5)
+            if target_size is not None:
+                size_min = coerce_float(metadata.get("size_min_mm"))
+                size_max = coerce_float(metadata.get("size_max_mm"))
+                if size_min is not None and size_max is not None:
+                    if size_min <= target_size <= size_max:
+                        score += 2.0
+                    else:
+                        distance = min(abs(target_size - size_min), abs(target_size - size_max))
+                        score -= min(distance / 10.0, 1.5)
 
             if risk_level:
                 chunk_risk = metadata.get("risk_level")
                 if chunk_risk and chunk_risk.lower() == risk_level:
                     score += 0.5
 
-            reranked.append(
-                RetrievedDocument(
-                    id=doc.id,
-                    text=doc.text,
-                    score=score,
-                    metadata=metadata,
-                )
-            )
+            reranked.append(RetrievedDocument(doc.id, doc.text, score, metadata))
 
-        reranked.sort(key=lambda item: item.score, reverse=True)
+        reranked.sort(key=_SCORE, reverse=True)
         return reranked
 
     # ------------------------------------------------------------------ #
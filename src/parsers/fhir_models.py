@@ -8,14 +8,25 @@ the HL7 specification.
 
 from __future__ import annotations
 
-import base64
 import binascii
 from datetime import date, datetime
-from typing import Any, Dict, List, Literal, Optional
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+)
 from typing_extensions import Self
 
+try:  # pragma: no cover - optional dependency
+    from pybase64 import b64decode as _b64decode  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    from base64 import b64decode as _b64decode
+
 
 def _parse_datetime(value: Any) -> datetime:
     """Parse an ISO 8601 datetime string, supporting the trailing Z shorthand."""
@@ -23,6 +34,11 @@ def _parse_datetime(value: Any) -> datetime:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
+        # Python 3.11+ parses canonical FHIR timestamps, trailing Z included, in C.
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
         cleaned = value.strip()
         if cleaned.endswith("Z"):
             cleaned = f"{cleaned[:-1]}+00:00"
@@ -56,12 +72,23 @@ class FHIRBaseModel(BaseModel):
 
         return self.model_dump(by_alias=True, exclude_none=True)
 
+    def to_fhir_json(self) -> bytes:
+        """Return the FHIR JSON encoding as bytes, serialized in a single pass."""
+
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
+
     @classmethod
     def from_fhir(cls, data: Dict[str, Any]) -> Self:
         """Instantiate the model from a FHIR JSON dictionary."""
 
         return cls.model_validate(data)
 
+    @classmethod
+    def from_fhir_json(cls, raw: Union[bytes, str]) -> Self:
+        """Instantiate the model straight from FHIR JSON text, skipping ``json.loads``."""
+
+        return cls.model_validate_json(raw)
+
 
 class Reference(FHIRBaseModel):
     """FHIR Reference type pointing to another resource.
@@ -115,7 +142,11 @@ class CodeableConcept(FHIRBaseModel):
     @field_validator("coding")
     @classmethod
     def _prune_empty_codings(cls, values: List[Coding]) -> List[Coding]:
-        return [coding for coding in values if coding.model_dump(exclude_none=True)]
+        return [
+            coding
+            for coding in values
+            if coding.system is not None or coding.code is not None or coding.display is not None
+        ]
 
 
 class Identifier(FHIRBaseModel):
@@ -154,7 +185,7 @@ class Attachment(FHIRBaseModel):
 
     Example
     -------
-    >>> Attachment(contentType="text/plain", data=base64.b64encode(b"hello").decode()).to_fhir()
+    >>> Attachment(contentType="text/plain", data="aGVsbG8=").to_fhir()
     {'contentType': 'text/plain', 'data': 'aGVsbG8='}
     """
 
@@ -171,7 +202,7 @@ class Attachment(FHIRBaseModel):
         if value is None:
             return value
         try:
-            base64.b64decode(value, validate=True)
+            _b64decode(value, validate=True)
         except (ValueError, binascii.Error) as exc:
             raise ValueError("Attachment.data must be base64 encoded") from exc
         return value.strip()
@@ -278,15 +309,23 @@ class DiagnosticReport(FHIRBaseModel):
     presentedForm: Optional[List[Attachment]] = Field(
         default=None, description="Attachments such as PDFs or structured documents"
     )
+    resourceType: Optional[str] = Field(
+        default=None, exclude=True, description="resourceType as read from FHIR JSON"
+    )
 
     @field_validator("effectiveDateTime", mode="before")
     @classmethod
     def _coerce_effective(cls, value: Any) -> datetime:
         return _parse_datetime(value)
 
+    @model_serializer(mode="wrap")
+    def _serialize_resource_type(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        payload = handler(self)
+        payload["resourceType"] = "DiagnosticReport"
+        return payload
+
     def to_fhir(self) -> Dict[str, Any]:
         payload = super().to_fhir()
-        payload["resourceType"] = "DiagnosticReport"
         payload["effectiveDateTime"] = self.effectiveDateTime.isoformat()
         return payload
 
@@ -296,6 +335,13 @@ class DiagnosticReport(FHIRBaseModel):
             raise ValueError("Expected resourceType 'DiagnosticReport'")
         return super().from_fhir(data)
 
+    @classmethod
+    def from_fhir_json(cls, raw: Union[bytes, str]) -> Self:
+        resource = super().from_fhir_json(raw)
+        if resource.resourceType != "DiagnosticReport":
+            raise ValueError("Expected resourceType 'DiagnosticReport'")
+        return resource
+
 
 class Patient(FHIRBaseModel):
     """FHIR Patient resource capturing demographic context.
@@ -320,15 +366,23 @@ class Patient(FHIRBaseModel):
     gender: Literal["male", "female", "other", "unknown"] = Field(
         ..., description="Administrative gender"
     )
+    resourceType: Optional[str] = Field(
+        default=None, exclude=True, description="resourceType as read from FHIR JSON"
+    )
 
     @field_validator("birthDate", mode="before")
     @classmethod
     def _coerce_birthdate(cls, value: Any) -> date:
         return _parse_date(value)
 
+    @model_serializer(mode="wrap")
+    def _serialize_resource_type(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        payload = handler(self)
+        payload["resourceType"] = "Patient"
+        return payload
+
     def to_fhir(self) -> Dict[str, Any]:
         payload = super().to_fhir()
-        payload["resourceType"] = "Patient"
         payload["birthDate"] = self.birthDate.isoformat()
         return payload
 
@@ -338,6 +392,13 @@ class Patient(FHIRBaseModel):
             raise ValueError("Expected resourceType 'Patient'")
         return super().from_fhir(data)
 
+    @classmethod
+    def from_fhir_json(cls, raw: Union[bytes, str]) -> Self:
+        resource = super().from_fhir_json(raw)
+        if resource.resourceType != "Patient":
+            raise ValueError("Expected resourceType 'Patient'")
+        return resource
+
 
 class ServiceRequest(FHIRBaseModel):
     """FHIR ServiceRequest describing follow-up imaging orders.
@@ -367,15 +428,23 @@ class ServiceRequest(FHIRBaseModel):
         default=None, description="Reference to a supporting DiagnosticReport"
     )
     note: Optional[List[Annotation]] = Field(default=None, description="Clinical notes")
+    resourceType: Optional[str] = Field(
+        default=None, exclude=True, description="resourceType as read from FHIR JSON"
+    )
 
     @field_validator("authoredOn", mode="before")
     @classmethod
     def _coerce_authored_on(cls, value: Any) -> datetime:
         return _parse_datetime(value)
 
+    @model_serializer(mode="wrap")
+    def _serialize_resource_type(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        payload = handler(self)
+        payload["resourceType"] = "ServiceRequest"
+        return payload
+
     def to_fhir(self) -> Dict[str, Any]:
         payload = super().to_fhir()
-        payload["resourceType"] = "ServiceRequest"
         payload["authoredOn"] = self.authoredOn.isoformat()
         return payload
 
@@ -384,3 +453,10 @@ class ServiceRequest(FHIRBaseModel):
         if data.get("resourceType") != "ServiceRequest":
             raise ValueError("Expected resourceType 'ServiceRequest'")
         return super().from_fhir(data)
+
+    @classmethod
+    def from_fhir_json(cls, raw: Union[bytes, str]) -> Self:
+        resource = super().from_fhir_json(raw)
+        if resource.resourceType != "ServiceRequest":
+            raise ValueError("Expected resourceType 'ServiceRequest'")
+        return resource
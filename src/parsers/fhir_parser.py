@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import base64
 import binascii
 import io
-import re
 from datetime import date, datetime, timezone
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 from urllib.parse import unquote_to_bytes
 
 from pydantic import ValidationError
 
-from src.parsers.fhir_models import Attachment, DiagnosticReport, Patient
+from src.parsers.fhir_models import (
+    Attachment,
+    DiagnosticReport,
+    Patient,
+    _b64decode,
+)
 from src.utils.logger import get_logger
 
 try:  # pragma: no cover - optional dependency
@@ -45,32 +48,11 @@ class FHIRParser:
 
         LOGGER.debug("Parsing DiagnosticReport resource.", extra={"context": {"id": fhir_json.get("id")}})
 
-        if not self.validate_diagnostic_report(fhir_json):
+        report = self._parse_validated_report(fhir_json)
+        if report is None:
             raise ValueError("Invalid DiagnosticReport resource.")
 
-        try:
-            report = DiagnosticReport.from_fhir(fhir_json)
-        except (ValueError, ValidationError) as exc:
-            LOGGER.error(
-                "Failed to parse DiagnosticReport payload.",
-                extra={"context": {"error": str(exc), "id": fhir_json.get("id")}},
-            )
-            raise
-
-        report_text = self._extract_report_text(report)
-        if not report_text:
-            LOGGER.error(
-                "DiagnosticReport is missing narrative content.",
-                extra={"context": {"id": report.id}},
-            )
-            raise ValueError("DiagnosticReport must contain conclusion or textual attachment data.")
-
-        patient_metadata = self.extract_patient_context(
-            report.subject.reference,
-            bundle=fhir_json,
-        )
-
-        return report_text, patient_metadata
+        return self._summarize_report(report, bundle=fhir_json)
 
     def extract_patient_context(self, patient_reference: str, bundle: Optional[Dict] = None) -> PatientMetadata:
         """Return patient metadata from a reference string and optional bundle."""
@@ -111,6 +93,11 @@ class FHIRParser:
     def validate_diagnostic_report(self, fhir_json: Dict) -> bool:
         """Validate required DiagnosticReport fields and log issues."""
 
+        return self._parse_validated_report(fhir_json) is not None
+
+    def _parse_validated_report(self, fhir_json: Dict) -> Optional[DiagnosticReport]:
+        """Return the validated DiagnosticReport, or ``None`` after logging why it was rejected."""
+
         try:
             report = DiagnosticReport.from_fhir(fhir_json)
         except (ValueError, ValidationError) as exc:
@@ -118,26 +105,48 @@ class FHIRParser:
                 "DiagnosticReport validation error.",
                 extra={"context": {"error": str(exc), "resourceType": fhir_json.get("resourceType")}},
             )
-            return False
-
-        missing: List[str] = []
-        if not report.id:
-            missing.append("id")
-        if not report.status:
-            missing.append("status")
-        if not report.code or not (report.code.text or report.code.coding):
-            missing.append("code")
-        if not report.subject or not report.subject.reference:
-            missing.append("subject")
-
-        if missing:
+            return None
+
+        return report if self._has_required_fields(report) else None
+
+    @staticmethod
+    def _has_required_fields(report: DiagnosticReport) -> bool:
+        """Return False, logging the gap, when the report code has neither text nor codings.
+
+        The model already rejects an empty ``id``, an unknown ``status`` and a
+        ``subject`` without a reference, but ``code`` may validate as ``{}``.
+        """
+
+        if report.code.text or report.code.coding:
+            return True
+
+        LOGGER.error(
+            "DiagnosticReport missing required fields.",
+            extra={"context": {"id": report.id, "missing": ["code"]}},
+        )
+        return False
+
+    def _summarize_report(
+        self,
+        report: DiagnosticReport,
+        bundle: Optional[Dict],
+    ) -> Tuple[str, PatientMetadata]:
+        """Return the narrative text and patient metadata for a parsed report."""
+
+        report_text = self._extract_report_text(report)
+        if not report_text:
             LOGGER.error(
-                "DiagnosticReport missing required fields.",
-                extra={"context": {"id": report.id, "missing": missing}},
+                "DiagnosticReport is missing narrative content.",
+                extra={"context": {"id": report.id}},
             )
-            return False
+            raise ValueError("DiagnosticReport must contain conclusion or textual attachment data.")
+
+        patient_metadata = self.extract_patient_context(
+            report.subject.reference,
+            bundle=bundle,
+        )
 
-        return True
+        return report_text, patient_metadata
 
     def _extract_report_text(self, report: DiagnosticReport) -> str:
         """Extract narrative text from conclusion or presentedForm attachments."""
@@ -175,7 +184,7 @@ class FHIRParser:
         """Decode a base64 payload, handling text and PDF content types."""
 
         try:
-            decoded = base64.b64decode(payload, validate=True)
+            decoded = _b64decode(payload, validate=True)
         except (ValueError, binascii.Error) as exc:
             LOGGER.warning(
                 "Attachment payload is not valid base64; returning raw text.",
@@ -194,13 +203,14 @@ class FHIRParser:
     def _decode_data_url(self, url: str) -> Optional[str]:
         """Decode a data URL containing base64 or percent-encoded text."""
 
-        match = re.match(r"^data:(?P<mime>[^;]+);(?P<encoding>[^,]+),(?P<payload>.+)$", url, re.IGNORECASE)
-        if not match:
+        if url[:5].lower() != "data:":
+            return None
+        mime, has_params, rest = url[5:].partition(";")
+        encoding, has_payload, payload = rest.partition(",")
+        if not (mime and has_params and encoding and has_payload and payload):
             return None
-        encoding = match.group("encoding").lower()
-        payload = match.group("payload")
-        if "base64" in encoding:
-            return self._decode_base64_payload(payload, match.group("mime"))
+        if "base64" in encoding.lower():
+            return self._decode_base64_payload(payload, mime)
         try:
             return unquote_to_bytes(payload).decode("utf-8").strip()
         except Exception as exc:  # pragma: no cover - defensive
@@ -213,8 +223,9 @@ class FHIRParser:
         if pdfplumber:
             try:
                 with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                    pages = [page.extract_text() or "" for page in pdf.pages]
-                text = "\n".join(filter(None, pages)).strip()
+                    text = "\n".join(
+                        page_text for page in pdf.pages if (page_text := page.extract_text())
+                    ).strip()
                 if text:
                     return text
             except Exception as exc:  # pragma: no cover - optional dependency
@@ -223,8 +234,9 @@ class FHIRParser:
         if PyPDF2:
             try:
                 reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
-                pages = [page.extract_text() or "" for page in reader.pages]
-                text = "\n".join(filter(None, pages)).strip()
+                text = "\n".join(
+                    page_text for page in reader.pages if (page_text := page.extract_text())
+                ).strip()
                 if text:
                     return text
             except Exception as exc:  # pragma: no cover - optional dependency
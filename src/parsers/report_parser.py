@@ -15,6 +15,8 @@ SECTION_HEADER_PATTERN = re.compile(
     r"(?im)^(?P<header>[A-Za-z][A-Za-z0-9 /\\-]{1,60})\s*:\s*(?P<inline>.*)$"
 )
 
+HEADER_NOISE_PATTERN = re.compile(r"[^a-z0-9]+")
+
 SECTION_ALIASES: Dict[str, Iterable[str]] = {
     "findings": {"findings", "finding", "results", "observations"},
     "impression": {"impression", "impressions", "conclusion", "assessment", "summary"},
@@ -24,9 +26,9 @@ SECTION_ALIASES: Dict[str, Iterable[str]] = {
 # Extraction patterns
 # --------------------------------------------------------------------------- #
 
-SIZE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(mm|millimeters?|cm|centimeters?)", re.IGNORECASE)
-SIZE_COMPOSITE_PATTERN = re.compile(
-    r"(?P<first>\d+(?:\.\d+)?)\s*(?:x|×|\u00d7)\s*(?P<second>\d+(?:\.\d+)?)\s*(?P<unit>mm|millimeters?|cm|centimeters?)",
+# A bare size ("6 mm") or a composite one ("1.2 x 0.8 cm"); ``second`` is None for bare sizes.
+SIZE_PATTERN = re.compile(
+    r"(?P<first>\d+(?:\.\d+)?)(?:\s*[x×]\s*(?P<second>\d+(?:\.\d+)?))?\s*(?P<unit>mm|millimeters?|cm|centimeters?)",
     re.IGNORECASE,
 )
 
@@ -62,11 +64,43 @@ CHARACTERISTIC_PATTERNS: Dict[re.Pattern[str], str] = {
     re.compile(r"\bconsolidation\b", re.IGNORECASE): "consolidation",
 }
 
+
+def _fuse_patterns(patterns: Dict[re.Pattern[str], str]) -> Tuple[re.Pattern[str], Tuple[str, ...]]:
+    """Combine a table of ``\\b...\\b`` patterns into one regex with a group per entry.
+
+    The alternation sits in a lookahead tried at every word start, so hits
+    nested inside another (``solid`` within ``part-solid``) are still found.
+    ``match.lastindex - 1`` indexes the returned labels.
+    """
+
+    bodies: List[str] = []
+    for pattern in patterns:
+        source = pattern.pattern
+        if not (source.startswith(r"\b") and source.endswith(r"\b")):
+            raise ValueError(f"Pattern must be word-bounded on both sides: {source!r}")
+        bodies.append(f"({source[2:-2]})")
+    fused = re.compile(rf"\b(?=(?:{'|'.join(bodies)})\b)", re.IGNORECASE)
+    return fused, tuple(patterns.values())
+
+
+def _labels_in_table_order(pattern: re.Pattern[str], labels: Tuple[str, ...], text: str) -> List[str]:
+    """Return unique labels for the table entries found in ``text``, in table order."""
+
+    hits = sorted({match.lastindex for match in pattern.finditer(text)})
+    return list(dict.fromkeys(labels[index - 1] for index in hits))
+
+
+LUNG_LOCATION_UNION, LUNG_LOCATION_LABELS = _fuse_patterns(LUNG_LOCATION_PATTERNS)
+CHARACTERISTIC_UNION, CHARACTERISTIC_LABELS = _fuse_patterns(CHARACTERISTIC_PATTERNS)
+
 FINDING_KEYWORDS = re.compile(
     r"\b(nodule|mass|lesion|opacity|ground[-\s]?glass|consolidation|adenopathy|cyst|tumou?r|metastasis)\b",
     re.IGNORECASE,
 )
 
+LIST_MARKER_PATTERN = re.compile(r"^\d+[\.\)]\s*")
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.])\s+(?=[A-Z])")
+
 UNCERTAINTY_PATTERN = re.compile(
     r"\b(possible|possibly|probable|probably|suggests?|may represent|cannot exclude|indeterminate)\b",
     re.IGNORECASE,
@@ -132,35 +166,20 @@ class ReportParser:
     def extract_measurements(self, text: str) -> List[Tuple[float, str]]:
         """Extract size measurements from the text, normalised to millimetres."""
 
-        measurements_with_pos: List[Tuple[int, float]] = []
-        consumed_spans: List[Tuple[int, int]] = []
-
-        for match in SIZE_COMPOSITE_PATTERN.finditer(text):
-            first = float(match.group("first"))
-            second = float(match.group("second"))
-            unit = match.group("unit")
-            values_mm = [self._to_mm(first, unit), self._to_mm(second, unit)]
-            measurements_with_pos.append((match.start(), round(max(values_mm), 1)))
-            consumed_spans.append(match.span())
-
+        measurements: List[Tuple[float, str]] = []
         for match in SIZE_PATTERN.finditer(text):
-            span = match.span()
-            if any(start <= span[0] < end for start, end in consumed_spans):
-                continue
-            value = float(match.group(1))
-            unit = match.group(2)
-            measurements_with_pos.append((match.start(), round(self._to_mm(value, unit), 1)))
-
-        measurements_with_pos.sort(key=lambda item: item[0])
-        return [(value, "mm") for _, value in measurements_with_pos]
+            unit = match.group("unit")
+            value_mm = self._to_mm(float(match.group("first")), unit)
+            second = match.group("second")
+            if second is not None:
+                value_mm = max(value_mm, self._to_mm(float(second), unit))
+            measurements.append((round(value_mm, 1), "mm"))
+        return measurements
 
     def extract_locations(self, text: str) -> List[str]:
         """Return normalised anatomical location labels."""
 
-        locations: List[str] = []
-        for pattern, label in LUNG_LOCATION_PATTERNS.items():
-            if pattern.search(text):
-                locations.append(label)
+        locations = _labels_in_table_order(LUNG_LOCATION_UNION, LUNG_LOCATION_LABELS, text)
 
         for match in LIVER_SEGMENT_PATTERN.finditer(text):
             segment = match.group("segment").upper()
@@ -182,25 +201,28 @@ class ReportParser:
     def extract_characteristics(self, text: str) -> List[str]:
         """Return descriptive characteristics mentioned in the text."""
 
-        characteristics: List[str] = []
-        for pattern, label in CHARACTERISTIC_PATTERNS.items():
-            if pattern.search(text):
-                characteristics.append(label)
-        seen: set[str] = set()
-        unique: List[str] = []
-        for characteristic in characteristics:
-            if characteristic not in seen:
-                seen.add(characteristic)
-                unique.append(characteristic)
-        return unique
+        return _labels_in_table_order(CHARACTERISTIC_UNION, CHARACTERISTIC_LABELS, text)
 
-    def classify_finding_type(self, text: str, characteristics: List[str]) -> str:
-        """Infer the finding type using rules and extracted metadata."""
+    def classify_finding_type(
+        self,
+        text: str,
+        characteristics: List[str],
+        *,
+        measurements: Optional[List[Tuple[float, str]]] = None,
+        locations: Optional[List[str]] = None,
+    ) -> str:
+        """Infer the finding type using rules and extracted metadata.
+
+        Callers that already extracted ``measurements`` or ``locations`` from
+        ``text`` can pass them in to avoid scanning the text again.
+        """
 
         text_lower = text.lower()
-        measurements = self.extract_measurements(text)
+        if measurements is None:
+            measurements = self.extract_measurements(text)
         size_mm = measurements[0][0] if measurements else None
-        locations = self.extract_locations(text)
+        if locations is None:
+            locations = self.extract_locations(text)
 
         if "ground-glass" in characteristics or "opacity" in text_lower:
             return "opacity"
@@ -229,7 +251,12 @@ class ReportParser:
         size_mm = measurements[0][0] if measurements else None
         locations = self.extract_locations(snippet)
         characteristics = self.extract_characteristics(snippet)
-        finding_type = self.classify_finding_type(snippet, characteristics)
+        finding_type = self.classify_finding_type(
+            snippet,
+            characteristics,
+            measurements=measurements,
+            locations=locations,
+        )
         location_display = locations[0] if locations else ""
         confidence = self._score_confidence(
             snippet,
@@ -255,11 +282,11 @@ class ReportParser:
             stripped = raw_line.strip()
             if not stripped:
                 continue
-            stripped = re.sub(r"^\d+[\.\)]\s*", "", stripped)
+            stripped = LIST_MARKER_PATTERN.sub("", stripped)
             stripped = stripped.lstrip("-•*").strip()
             if not stripped:
                 continue
-            parts = re.split(r"(?<=[.])\s+(?=[A-Z])", stripped)
+            parts = SENTENCE_BREAK_PATTERN.split(stripped)
             for part in parts:
                 candidate = part.strip()
                 if candidate:
@@ -352,7 +379,7 @@ def parse_report(report_text: str) -> List[Finding]:
 
 
 def _normalize_header(raw_header: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9]+", " ", raw_header.lower()).strip()
+    cleaned = HEADER_NOISE_PATTERN.sub(" ", raw_header.lower()).strip()
     for canonical, synonyms in SECTION_ALIASES.items():
         if cleaned in synonyms:
             return canonical
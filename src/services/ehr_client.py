@@ -84,8 +84,11 @@ class EHRClient:
             return order_id
 
         assert self._http_client is not None  # pragma: no cover - defensive
-        payload = request_model.to_fhir()
-        response = self._http_client.post("/ServiceRequest", json=payload)
+        response = self._http_client.post(
+            "/ServiceRequest",
+            content=request_model.to_fhir_json(),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
         body = response.json()
         order_id = self._extract_resource_id(body, response.headers.get("Location"))
@@ -107,9 +110,8 @@ class EHRClient:
         assert self._http_client is not None  # pragma: no cover - defensive
         response = self._http_client.get(f"/Patient/{patient_id}")
         response.raise_for_status()
-        data = response.json()
         try:
-            return Patient.from_fhir(data)
+            return Patient.from_fhir_json(response.content)
         except (ValueError, ValidationError) as exc:  # pragma: no cover - defensive
             LOGGER.error(
                 "Failed to parse Patient resource from EHR.",
@@ -134,9 +136,8 @@ class EHRClient:
         assert self._http_client is not None  # pragma: no cover - defensive
         response = self._http_client.get(f"/DiagnosticReport/{report_id}")
         response.raise_for_status()
-        data = response.json()
         try:
-            return DiagnosticReport.from_fhir(data)
+            return DiagnosticReport.from_fhir_json(response.content)
         except (ValueError, ValidationError) as exc:  # pragma: no cover - defensive
             LOGGER.error(
                 "Failed to parse DiagnosticReport resource from EHR.",
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+"""Shared HTTP connection pool for the NVIDIA NIM clients."""
+
+import threading
+from typing import Optional
+
+import httpx
+
+try:  # pragma: no cover - optional dependency
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore
+
+
+REQUEST_TIMEOUT_SECONDS = 30.0
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS = 64
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled client used for NIM requests.
+
+    Reusing one client keeps TLS connections alive across ``EmbeddingClient`` and
+    ``NemotronClient`` instances; HTTP/2 multiplexing is enabled when ``h2`` is
+    installed.
+    """
+
+    global _client  # noqa: PLW0603 - intended module-level state
+    if _client is None or _client.is_closed:
+        with _lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.Client(
+                    http2=h2 is not None,
+                    timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS,
+                    ),
+                )
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the shared client, e.g. on application shutdown."""
+
+    global _client  # noqa: PLW0603 - intended module-level state
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
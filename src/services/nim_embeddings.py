@@ -5,9 +5,11 @@ from __future__ import annotations
 import math
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 from openai import (
     APIConnectionError,
     APIError,
@@ -19,7 +21,8 @@ from openai import (
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 from tqdm.auto import tqdm
 
-from src.utils.config import get_settings
+from src.services.http_pool import get_http_client
+from src.utils.config import Settings, get_settings
 from src.utils.logger import get_logger, log_error, log_nim_call
 from src.services.nim_llm import NIMServiceError
 
@@ -32,8 +35,8 @@ class EmbeddingClient:
     MAX_TOKENS = 512
     EMBEDDING_DIMENSION = 768
 
-    def __init__(self) -> None:
-        settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        settings = settings or get_settings()
         api_key = (
             settings.NIM_EMBEDDING_API_KEY.get_secret_value()
             if settings.NIM_EMBEDDING_API_KEY is not None
@@ -46,6 +49,7 @@ class EmbeddingClient:
             base_url=str(settings.NIM_EMBEDDING_ENDPOINT),
             api_key=api_key,
             timeout=self.REQUEST_TIMEOUT_SECONDS,
+            http_client=get_http_client(),
         )
         self._logger = get_logger("audra.services.nim_embeddings")
 
@@ -119,28 +123,97 @@ class EmbeddingClient:
             )
         return normalized
 
-    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
-        """Embed a list of texts, processing them in batches."""
+    def embed_texts(self, texts: List[str], prefix: Optional[str] = None) -> List[List[float]]:
+        """Embed several texts with a single NV-Embed request.
+
+        Long texts are segmented exactly as in :meth:`embed_text`; every segment
+        of every text is submitted in one ``embeddings.create`` call and the
+        per-text vectors are averaged and normalised afterwards. The segment
+        cache is bypassed because batch callers (e.g. indexing) rarely repeat
+        inputs.
+        """
+
+        if not texts:
+            return []
+        if any(not text for text in texts):
+            raise ValueError("Texts must be non-empty strings.")
+
+        segments: list[str] = []
+        offsets: list[tuple[int, int]] = []
+        for text in texts:
+            text_segments = self._segment_text(text)
+            if prefix:
+                text_segments = [f"{prefix}{segment}" for segment in text_segments]
+            offsets.append((len(segments), len(segments) + len(text_segments)))
+            segments.extend(text_segments)
+
+        start_time = time.perf_counter()
+        vectors = self._fetch_embeddings_uncached(segments)
+        embeddings = self._pool_segments(vectors, [start for start, _ in offsets])
+
+        latency_ms = (time.perf_counter() - start_time) * 1000.0
+        self._record_metrics(latency_ms, count=len(texts))
+        self._logger.debug(
+            "Batch embedding request completed.",
+            extra={
+                "context": {
+                    "operation": "embed_texts",
+                    "latency_ms": latency_ms,
+                    "texts": len(texts),
+                    "segments": len(segments),
+                }
+            },
+        )
+        log_nim_call(
+            service="nv-embed",
+            prompt_tokens=sum(len(segment.split()) for segment in segments),
+            completion_tokens=0,
+            latency_ms=latency_ms,
+        )
+        return embeddings
+
+    def embed_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        max_concurrency: int = 4,
+    ) -> List[List[float]]:
+        """Embed a list of texts, sending one NV-Embed request per batch.
+
+        Texts are grouped by word count before batching so each request carries
+        similarly sized inputs; up to ``max_concurrency`` requests are in flight
+        at once, each with its own retries, and results are returned in the
+        original order.
+        """
 
         if batch_size <= 0:
             raise ValueError("batch_size must be positive.")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive.")
 
         if not texts:
             return []
 
-        embeddings: list[List[float]] = []
-        total_batches = max(1, math.ceil(len(texts) / batch_size))
-        iterator = range(0, len(texts), batch_size)
-        for start in tqdm(
-            iterator,
-            total=total_batches,
-            desc="Embedding batches",
-            disable=total_batches <= 1,
-        ):
-            batch = texts[start : start + batch_size]
-            for text in batch:
-                embeddings.append(self.embed_text(text))
-        return embeddings
+        order = sorted(range(len(texts)), key=lambda idx: len(texts[idx].split()))
+        batches = [order[start : start + batch_size] for start in range(0, len(order), batch_size)]
+        embeddings: list[Optional[List[float]]] = [None] * len(texts)
+
+        def _embed(batch_indices: List[int]) -> List[List[float]]:
+            return self.embed_texts([texts[idx] for idx in batch_indices])
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            for batch_indices, vectors in zip(
+                batches,
+                tqdm(
+                    executor.map(_embed, batches),
+                    total=len(batches),
+                    desc="Embedding batches",
+                    disable=len(batches) <= 1,
+                ),
+            ):
+                for idx, vector in zip(batch_indices, vectors):
+                    embeddings[idx] = vector
+        return embeddings  # type: ignore[return-value]
 
     def get_query_embedding(self, query: str) -> List[float]:
         """Return an embedding configured for query semantics."""
@@ -194,33 +267,41 @@ class EmbeddingClient:
         return vector, cache_hit
 
     def _fetch_embedding_uncached(self, text: str) -> List[float]:
-        def _request() -> List[float]:
+        return self._fetch_embeddings_uncached([text])[0]
+
+    def _fetch_embeddings_uncached(self, texts: List[str]) -> List[List[float]]:
+        def _request() -> List[List[float]]:
             self._logger.debug(
                 "Submitting NV-Embed request.",
                 extra={
                     "context": {
                         "operation": "embed_text",
-                        "segment_preview": text[:64],
+                        "inputs": len(texts),
+                        "segment_preview": texts[0][:64],
                     }
                 },
             )
             response = self._client.embeddings.create(
                 model=self.MODEL_NAME,
-                input=[text],
+                input=texts,
             )
-            if not response.data:
+            if not response.data or len(response.data) != len(texts):
                 raise NIMServiceError("No embedding data returned from NV-Embed.")
-            vector = response.data[0].embedding
-            if len(vector) != self.EMBEDDING_DIMENSION:
-                raise NIMServiceError(
-                    f"Unexpected embedding dimensionality: {len(vector)} (expected {self.EMBEDDING_DIMENSION})."
-                )
-            return list(vector)
+            items = sorted(response.data, key=lambda item: getattr(item, "index", 0))
+            vectors: list[List[float]] = []
+            for item in items:
+                vector = item.embedding
+                if len(vector) != self.EMBEDDING_DIMENSION:
+                    raise NIMServiceError(
+                        f"Unexpected embedding dimensionality: {len(vector)} (expected {self.EMBEDDING_DIMENSION})."
+                    )
+                vectors.append(list(vector))
+            return vectors
 
         try:
             return self._retryer(_request)
         except (RateLimitError, APITimeoutError, APIConnectionError, APIError, OpenAIError) as exc:
-            self._log_exception("embed_text", exc, {"segment_preview": text[:64]})
+            self._log_exception("embed_text", exc, {"segment_preview": texts[0][:64], "inputs": len(texts)})
             raise NIMServiceError("Failed to fetch embedding from NV-Embed.") from exc
 
     def _segment_text(self, text: str) -> List[str]:
@@ -250,15 +331,32 @@ class EmbeddingClient:
         count = float(len(vectors))
         return [value / count for value in accumulator]
 
+    def _pool_segments(self, vectors: List[List[float]], starts: List[int]) -> List[List[float]]:
+        """Average each text's segment vectors and L2-normalise them in one pass.
+
+        ``starts`` holds the index of every text's first segment in ``vectors``;
+        segments of one text are contiguous.
+        """
+
+        matrix = np.asarray(vectors, dtype=np.float64)
+        if matrix.ndim != 2:
+            raise NIMServiceError("Mismatched vector dimensionality during averaging.")
+        boundaries = np.asarray(starts, dtype=np.intp)
+        counts = np.diff(np.append(boundaries, matrix.shape[0]))
+        pooled = np.add.reduceat(matrix, boundaries, axis=0) / counts[:, None]
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return (pooled / norms).tolist()
+
     def _normalize(self, vector: List[float]) -> List[float]:
         norm = math.sqrt(sum(value * value for value in vector))
         if norm == 0.0:
             return vector
         return [value / norm for value in vector]
 
-    def _record_metrics(self, latency_ms: float) -> None:
+    def _record_metrics(self, latency_ms: float, count: int = 1) -> None:
         with self._metrics_lock:
-            self._total_embeddings += 1
+            self._total_embeddings += count
             self._latencies_ms.append(latency_ms)
 
     def _record_cache(self, cache_hit: bool) -> None:
@@ -20,7 +20,8 @@ from openai import (
 )
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from src.utils.config import get_settings
+from src.services.http_pool import get_http_client
+from src.utils.config import Settings, get_settings
 from src.utils.logger import get_logger, log_error, log_nim_call
 
 
@@ -44,8 +45,8 @@ class NemotronClient:
     MODEL_NAME = "meta/llama-3.1-nemotron-70b-instruct"
     REQUEST_TIMEOUT_SECONDS = 30.0
 
-    def __init__(self) -> None:
-        settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        settings = settings or get_settings()
         api_key = (
             settings.NIM_LLM_API_KEY.get_secret_value()
             if settings.NIM_LLM_API_KEY is not None
@@ -58,6 +59,7 @@ class NemotronClient:
             base_url=str(settings.NIM_LLM_ENDPOINT),
             api_key=api_key,
             timeout=self.REQUEST_TIMEOUT_SECONDS,
+            http_client=get_http_client(),
         )
 
         self._logger = get_logger("audra.services.nim_llm")
@@ -5,24 +5,35 @@ from __future__ import annotations
 import math
 import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import boto3
+import numpy as np
 from botocore.exceptions import BotoCoreError, NoCredentialsError
 from opensearchpy import AWSV4SignerAuth, OpenSearch, RequestsHttpConnection, helpers
 from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError
 from opensearchpy.exceptions import OpenSearchException, TransportError
-from tqdm.auto import tqdm
+from opensearchpy.serializer import JSONSerializer
 
-from src.utils.config import get_settings
+from src.utils.config import Settings, get_settings
 from src.utils.logger import get_logger, log_error
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 
 class VectorStoreError(RuntimeError):
     """Raised when vector store operations fail."""
 
 
+# Stored vectors are int8 with an unrecorded per-row scale (see quantize_embeddings),
+# so the space type must stay scale-invariant: cosine, never innerproduct or l2.
+EMBEDDING_SPACE_TYPE = "cosinesimil"
+
 INDEX_MAPPING = {
     "mappings": {
         "properties": {
@@ -30,10 +41,11 @@ INDEX_MAPPING = {
             "embedding": {
                 "type": "knn_vector",
                 "dimension": 768,
+                "data_type": "byte",
                 "method": {
                     "name": "hnsw",
-                    "space_type": "cosinesimil",
-                    "engine": "nmslib",
+                    "space_type": EMBEDDING_SPACE_TYPE,
+                    "engine": "lucene",
                 },
             },
             "metadata": {
@@ -51,16 +63,73 @@ INDEX_MAPPING = {
 }
 
 
+BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+
+
+class OrjsonSerializer(JSONSerializer):
+    """Request/response serializer backed by orjson.
+
+    Bulk bodies are dominated by embedding arrays, which orjson encodes several
+    times faster than the stdlib encoder. Payloads orjson rejects (e.g. non-string
+    keys) fall back to the default serializer.
+    """
+
+    def dumps(self, data):  # type: ignore[override]
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(
+                data,
+                default=self.default,
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return super().dumps(data)
+
+    def loads(self, s):  # type: ignore[override]
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s)
+
+
+def quantize_embeddings(embeddings: Sequence[Sequence[float]]) -> List[List[int]]:
+    """Quantize embeddings to int8 using a symmetric per-row scale.
+
+    Each row is divided by ``max(|x|) / 127`` and rounded, so stored vectors take
+    one byte per dimension instead of four. The scale is not stored, so rows end
+    up on different scales. That is safe only because the index ranks by cosine
+    similarity: ``cos(a * s, b * t) == cos(a, b)`` for any positive ``s`` and
+    ``t``, so dropping the scales changes scores by rounding error alone. Inner
+    product or L2 would rank by the arbitrary scales instead.
+    """
+
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    peak = np.abs(matrix).max(axis=1, keepdims=True)
+    scale = np.where(peak > 0, peak / 127.0, 1.0)
+    return np.rint(matrix / scale).astype(np.int8).tolist()
+
+
 class VectorStore:
     """High-level interface for similarity and hybrid search over guideline documents."""
 
     REQUEST_TIMEOUT = 30
     RETRY_ATTEMPTS = 3
+    BULK_MAX_RETRIES = 3
 
-    def __init__(self, index_name: str = "medical_guidelines") -> None:
+    def __init__(
+        self,
+        index_name: str = "medical_guidelines",
+        settings: Optional[Settings] = None,
+        *,
+        verify_mapping: bool = True,
+    ) -> None:
         self._logger = get_logger("audra.services.vector_store")
-        self._settings = get_settings()
+        self._settings = settings or get_settings()
         self.index_name = index_name
+        self._verify_mapping = verify_mapping
         self._client = self._create_client()
         self._lock = threading.Lock()
         self._ensure_index()
@@ -77,7 +146,11 @@ class VectorStore:
     ) -> None:
         """Index (or upsert) a single document."""
 
-        document = {"text": text, "embedding": embedding, "metadata": metadata}
+        document = {
+            "text": text,
+            "embedding": quantize_embeddings([embedding])[0],
+            "metadata": metadata,
+        }
         self._execute_with_retry(
             lambda: self._client.index(
                 index=self.index_name,
@@ -90,46 +163,79 @@ class VectorStore:
             context={"doc_id": doc_id},
         )
 
-    def index_batch(self, documents: List[Dict[str, object]], batch_size: int = 100) -> None:
-        """Bulk index a collection of documents."""
+    def index_batch(
+        self,
+        documents: List[Dict[str, object]],
+        batch_size: int = 100,
+        *,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        concurrency: int = 1,
+    ) -> None:
+        """Bulk index a collection of documents.
+
+        Actions are streamed through ``helpers.bulk`` so each chunk of
+        ``batch_size`` documents (capped at ``max_chunk_bytes``) is sent as a
+        single ``_bulk`` request. Throttled (429) chunks are retried with
+        exponential backoff by the helper itself. With ``concurrency`` above one
+        the documents are split into that many contiguous slices uploaded from
+        separate threads; small batches with two or so concurrent requests
+        usually saturate a cluster, and more tends to trigger throttling.
+        """
 
         if batch_size <= 0:
             raise ValueError("batch_size must be positive.")
+        if max_chunk_bytes <= 0:
+            raise ValueError("max_chunk_bytes must be positive.")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive.")
         if not documents:
             return
 
-        total_batches = math.ceil(len(documents) / batch_size)
-        iterator = range(0, len(documents), batch_size)
-
-        for start in tqdm(
-            iterator,
-            total=total_batches,
-            desc="Indexing documents",
-            disable=total_batches <= 1,
-        ):
-            batch = documents[start : start + batch_size]
-            actions = [
-                {
-                    "_op_type": "index",
-                    "_index": self.index_name,
-                    "_id": doc["id"],
-                    "_source": {
-                        "text": doc["text"],
-                        "embedding": doc["embedding"],
-                        "metadata": doc.get("metadata", {}),
-                    },
-                }
-                for doc in batch
-            ]
-            self._execute_with_retry(
+        vectors = quantize_embeddings([doc["embedding"] for doc in documents])
+        slice_size = math.ceil(len(documents) / concurrency)
+        slices = [
+            (documents[start : start + slice_size], vectors[start : start + slice_size])
+            for start in range(0, len(documents), slice_size)
+        ]
+
+        def _upload(part: Tuple[List[Dict[str, object]], List[List[int]]]) -> List[object]:
+            part_documents, part_vectors = part
+            _, part_errors = self._execute_with_retry(
                 lambda: helpers.bulk(
                     self._client,
-                    actions,
+                    self._bulk_actions(part_documents, part_vectors),
+                    chunk_size=batch_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    max_retries=self.BULK_MAX_RETRIES,
+                    initial_backoff=2,
+                    raise_on_error=False,
                     refresh="wait_for",
                     request_timeout=self.REQUEST_TIMEOUT,
                 ),
                 operation="index_batch",
-                context={"batch_start": start, "batch_count": len(batch)},
+                context={"document_count": len(part_documents), "batch_size": batch_size},
+            )
+            return part_errors
+
+        if len(slices) == 1:
+            errors = _upload(slices[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+                errors = [error for part_errors in executor.map(_upload, slices) for error in part_errors]
+
+        if errors:
+            self._logger.error(
+                "Bulk indexing rejected documents.",
+                extra={
+                    "context": {
+                        "failed": len(errors),
+                        "total": len(documents),
+                        "first_error": errors[0],
+                    }
+                },
+            )
+            raise VectorStoreError(
+                f"Bulk indexing failed for {len(errors)} of {len(documents)} documents."
             )
 
     def search(
@@ -192,6 +298,12 @@ class VectorStore:
             operation="delete_index",
         )
 
+    def recreate_index(self) -> None:
+        """Drop and recreate the backing index, reusing the existing client."""
+
+        self.delete_index()
+        self._ensure_index()
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
@@ -218,6 +330,7 @@ class VectorStore:
                 timeout=self.REQUEST_TIMEOUT,
                 max_retries=2,
                 retry_on_timeout=True,
+                serializer=self._serializer(),
             )
 
         region = self._settings.AWS_REGION
@@ -247,8 +360,30 @@ class VectorStore:
             timeout=self.REQUEST_TIMEOUT,
             max_retries=3,
             retry_on_timeout=True,
+            serializer=self._serializer(),
         )
 
+    @staticmethod
+    def _serializer() -> JSONSerializer:
+        return OrjsonSerializer() if orjson is not None else JSONSerializer()
+
+    def _bulk_actions(
+        self,
+        documents: List[Dict[str, object]],
+        vectors: List[List[int]],
+    ) -> Iterator[Dict[str, object]]:
+        for doc, vector in zip(documents, vectors):
+            yield {
+                "_op_type": "index",
+                "_index": self.index_name,
+                "_id": doc["id"],
+                "_source": {
+                    "text": doc["text"],
+                    "embedding": vector,
+                    "metadata": doc.get("metadata", {}),
+                },
+            }
+
     def _ensure_index(self) -> None:
         with self._lock:
             exists = self._execute_with_retry(
@@ -256,6 +391,8 @@ class VectorStore:
                 operation="check_index",
             )
             if exists:
+                if self._verify_mapping:
+                    self._check_embedding_mapping()
                 return
             self._logger.debug(
                 "Creating vector index if absent.",
@@ -269,6 +406,34 @@ class VectorStore:
                 operation="create_index",
             )
 
+    def _check_embedding_mapping(self) -> None:
+        """Raise if the live index stores embeddings differently from INDEX_MAPPING.
+
+        Indexes created before the switch to int8 vectors keep float/nmslib
+        mappings; writing quantized vectors into them would silently corrupt
+        search, so they must be recreated and re-indexed instead.
+        """
+
+        response = self._execute_with_retry(
+            lambda: self._client.indices.get_mapping(index=self.index_name),
+            operation="get_mapping",
+        )
+        expected = INDEX_MAPPING["mappings"]["properties"]["embedding"]
+        for index, body in (response or {}).items():
+            actual = body.get("mappings", {}).get("properties", {}).get("embedding", {})
+            actual_method = actual.get("method", {})
+            mismatched = [key for key in ("dimension", "data_type") if actual.get(key) != expected[key]]
+            mismatched.extend(
+                f"method.{key}"
+                for key in ("engine", "space_type")
+                if actual_method.get(key) != expected["method"][key]
+            )
+            if mismatched:
+                raise VectorStoreError(
+                    f"Index '{index}' has an incompatible embedding mapping ({', '.join(mismatched)}); "
+                    "recreate it (e.g. scripts/index_guidelines.py --drop-existing) and re-index."
+                )
+
     def _execute_with_retry(
         self,
         func,
@@ -315,7 +480,7 @@ class VectorStore:
         num_candidates = max(top_k * 4, 50)
         knn_query: Dict[str, object] = {
             "field": "embedding",
-            "query_vector": embedding,
+            "query_vector": quantize_embeddings([embedding])[0],
             "k": top_k,
             "num_candidates": num_candidates,
         }
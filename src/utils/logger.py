@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from src.utils.config import get_settings
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 
 _thread_local = threading.local()
 _configured = False
@@ -42,6 +48,11 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            except orjson.JSONEncodeError:  # pragma: no cover - e.g. integers beyond 64 bits
+                pass
         return json.dumps(payload, default=str)
 
 
@@ -77,6 +88,15 @@ class DevFormatter(logging.Formatter):
         return formatted
 
 
+def new_correlation_id() -> str:
+    """Return a fresh 128-bit random correlation identifier as 32 hex characters.
+
+    Same entropy and format as ``uuid4().hex`` without the ``UUID`` object.
+    """
+
+    return os.urandom(16).hex()
+
+
 def set_correlation_id(correlation_id: Optional[str]) -> None:
     """Bind a correlation identifier to the current thread."""
 
@@ -5,7 +5,7 @@ from datetime import timezone
 import pytest
 
 
-from src.agent.prompts import format_prompt
+from src.agent.prompts import REACT_PROMPT, format_prompt
 from src.agent.state import AgentState, StateManager
 
 
@@ -63,3 +63,9 @@ def test_format_prompt_populates_placeholders() -> None:
     prompt = format_prompt("Finding: {finding}; Action: {action}", finding="RUL nodule", action="follow-up")
     assert "RUL nodule" in prompt
     assert "follow-up" in prompt
+
+
+def test_format_prompt_accepts_bundled_prompt_name() -> None:
+    by_name = format_prompt("REACT_PROMPT", state_summary="Status: parsing")
+    assert by_name == REACT_PROMPT.format(state_summary="Status: parsing")
+    assert format_prompt(REACT_PROMPT, state_summary="Status: parsing") == by_name
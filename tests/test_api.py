@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import date, timedelta
 import sys
+import threading
+import time
 import types
 from typing import Any, Dict
 
@@ -106,6 +110,7 @@ if "opensearchpy" not in sys.modules:
             self.indices = types.SimpleNamespace(
                 exists=lambda index: True,
                 create=lambda **kwargs: None,
+                get_mapping=lambda index: {},
             )
 
         def index(self, *args: Any, **kwargs: Any) -> None:
@@ -124,6 +129,26 @@ if "opensearchpy" not in sys.modules:
 
     sys.modules["opensearchpy"] = opensearch_module
 
+if "opensearchpy.serializer" not in sys.modules:
+    serializer_module = types.ModuleType("opensearchpy.serializer")
+
+    class JSONSerializer:
+        def default(self, data: Any) -> Any:
+            raise TypeError(f"Unable to serialize {data!r}")
+
+        def dumps(self, data: Any) -> str:
+            import json
+
+            return data if isinstance(data, str) else json.dumps(data, default=self.default)
+
+        def loads(self, s: str) -> Any:
+            import json
+
+            return json.loads(s)
+
+    serializer_module.JSONSerializer = JSONSerializer
+    sys.modules["opensearchpy.serializer"] = serializer_module
+
 if "opensearchpy.exceptions" not in sys.modules:
     exceptions_module = types.ModuleType("opensearchpy.exceptions")
 
@@ -190,11 +215,17 @@ if "slowapi.middleware" not in sys.modules:
 
 from src.api import app as app_module
 from src.api.app import create_app
-from src.api.models import RecommendationResponse
+from src.api.models import ProcessReportRequest, RecommendationResponse
+from src.api.vocab import CHARACTERISTICS
+from src.parsers.report_parser import CHARACTERISTIC_PATTERNS
+from src.agent.state import AgentState, StateManager
 from src.api.routes import (
     _build_finding,
+    _process_report,
+    _build_response_from_state,
     _build_tasks,
     _clamp_confidence,
+    get_session_trace_endpoint,
     health_check_endpoint,
 )
 
@@ -229,10 +260,19 @@ def test_build_finding_normalises_characteristics() -> None:
         "confidence": "0.75",
     }
     finding = _build_finding(payload)
-    assert finding.finding_id == "abc"
-    assert finding.size_mm == 6.0
-    assert finding.characteristics == ["spiculated"]
-    assert finding.confidence == pytest.approx(0.75)
+    assert finding["finding_id"] == "abc"
+    assert finding["size_mm"] == 6.0
+    assert finding["characteristics"] == ["spiculated"]
+    assert finding["confidence"] == pytest.approx(0.75)
+
+
+def test_build_finding_maps_values_outside_vocabulary() -> None:
+    finding = _build_finding(
+        {"type": "effusion", "characteristics": ["solid", "free-text note"], "confidence": 0.5}
+    )
+    assert finding["type"] == "unknown"
+    assert finding["characteristics"] == ["solid"]
+    assert set(CHARACTERISTIC_PATTERNS.values()) <= CHARACTERISTICS
 
 
 def test_build_tasks_generates_schedule_from_recommendations() -> None:
@@ -263,14 +303,14 @@ def test_build_tasks_generates_schedule_from_recommendations() -> None:
     assert len(tasks) == 2
 
     first = tasks[0]
-    assert first.task_id == "ORD-1"
-    assert first.procedure == "CT Chest"
-    assert today < first.scheduled_date <= today + timedelta(days=90)
+    assert first["task_id"] == "ORD-1"
+    assert first["procedure"] == "CT Chest"
+    assert today < first["scheduled_date"] <= today + timedelta(days=90)
 
     second = tasks[1]
-    assert second.task_id == "ORD-2"
-    assert second.procedure == "MRI Abdomen"
-    assert second.scheduled_date == today + timedelta(days=30)
+    assert second["task_id"] == "ORD-2"
+    assert second["procedure"] == "MRI Abdomen"
+    assert second["scheduled_date"] == today + timedelta(days=30)
 
 
 @pytest.mark.asyncio
@@ -312,3 +352,69 @@ async def test_health_check_endpoint_reflects_service_states(monkeypatch: pytest
     assert response.status == "unhealthy"
     assert response.services["vector_store"] == "degraded"
     assert response.services["ehr"] == "unhealthy"
+
+
+def test_create_app_registers_each_route_once() -> None:
+    app = create_app()
+    signatures = [
+        (route.path, tuple(sorted(getattr(route, "methods", None) or ())))
+        for route in app.routes
+    ]
+    assert len(signatures) == len(set(signatures))
+
+
+def test_openapi_includes_request_schemas_and_examples() -> None:
+    schema = create_app().openapi()
+    components = schema["components"]["schemas"]
+
+    assert "example" in components["ProcessReportRequest"]
+    assert components["BatchProcessRequest"]["properties"]["reports"]["items"] == {
+        "$ref": "#/components/schemas/ProcessReportRequest"
+    }
+    request_body = schema["paths"]["/api/v1/process-report"]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/ProcessReportRequest"
+    }
+
+
+@pytest.mark.asyncio
+async def test_process_report_caps_concurrent_agent_runs() -> None:
+    lock = threading.Lock()
+    active = peak = 0
+
+    class _SlowAgent:
+        def process_report(self, report_text: str, patient_context: Any = None, report_id: Any = None) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return f"processed:{report_id}"
+
+    slots = asyncio.Semaphore(2)
+    payloads = [ProcessReportRequest(report_text="x" * 60, report_id=f"RPT-{index}") for index in range(5)]
+    results = await asyncio.gather(
+        *(_process_report(_SlowAgent(), payload, slots) for payload in payloads)  # type: ignore[arg-type]
+    )
+
+    assert results == [f"processed:RPT-{index}" for index in range(5)]
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_session_trace_is_served_separately_from_response() -> None:
+    state = AgentState(session_id="trace-session", report_id="RPT-trace", report_text="x" * 60)
+    state.add_decision_step("parse_report", {"findings": 1})
+    StateManager.save_state(state)
+    try:
+        response = _build_response_from_state(state)
+        trace_response = await get_session_trace_endpoint(state.session_id)
+    finally:
+        StateManager.clear_state(state.session_id)
+
+    assert response.decision_trace is None
+    trace = json.loads(trace_response.body)
+    assert [entry["step"] for entry in trace] == ["parse_report"]
+    assert trace[0]["findings"] == 1
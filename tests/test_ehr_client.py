@@ -4,7 +4,7 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.parsers.fhir_models import CodeableConcept, Reference, Timing, TimingRepeat, ServiceRequest
+from src.parsers.fhir_models import Annotation, CodeableConcept, Reference, Timing, TimingRepeat, ServiceRequest
 from src.services.ehr_client import EHRClient
 
 
@@ -38,3 +38,22 @@ def test_mock_ehr_client_round_trip_service_request() -> None:
 
         report = client.get_diagnostic_report(report_id)
         assert report.id == report_id
+
+
+def test_service_request_to_fhir_json_serializes_nested_datetimes() -> None:
+    request = ServiceRequest(
+        id="order-1",
+        status="active",
+        intent="order",
+        code=CodeableConcept(text="CT Chest follow-up"),
+        subject=Reference(reference="Patient/patient-123"),
+        authoredOn=datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc),
+        occurrenceTiming=Timing(repeat=TimingRepeat(frequency=1, period=6, periodUnit="mo")),
+        note=[Annotation(text="Follow-up in 6 months.", time=datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc))],
+    )
+
+    payload = json.loads(request.to_fhir_json())
+
+    assert payload["resourceType"] == "ServiceRequest"
+    assert datetime.fromisoformat(payload["authoredOn"]) == request.authoredOn
+    assert payload["note"][0]["time"].startswith("2024-06-01T12:00:00")
@@ -103,6 +103,7 @@ if "opensearchpy" not in sys.modules:
             self.indices = types.SimpleNamespace(
                 exists=lambda index: True,
                 create=lambda **kwargs: None,
+                get_mapping=lambda index: {},
             )
 
         def index(self, *args: Any, **kwargs: Any) -> None:
@@ -121,6 +122,26 @@ if "opensearchpy" not in sys.modules:
 
     sys.modules["opensearchpy"] = opensearch_module
 
+if "opensearchpy.serializer" not in sys.modules:
+    serializer_module = types.ModuleType("opensearchpy.serializer")
+
+    class JSONSerializer:
+        def default(self, data: Any) -> Any:
+            raise TypeError(f"Unable to serialize {data!r}")
+
+        def dumps(self, data: Any) -> str:
+            import json
+
+            return data if isinstance(data, str) else json.dumps(data, default=self.default)
+
+        def loads(self, s: str) -> Any:
+            import json
+
+            return json.loads(s)
+
+    serializer_module.JSONSerializer = JSONSerializer
+    sys.modules["opensearchpy.serializer"] = serializer_module
+
 if "opensearchpy.exceptions" not in sys.modules:
     opensearch_exceptions = types.ModuleType("opensearchpy.exceptions")
 
@@ -147,7 +168,7 @@ if "tqdm.auto" not in sys.modules:
     tqdm_module.tqdm = tqdm
     sys.modules["tqdm.auto"] = tqdm_module
 
-from src.guidelines.indexer import GuidelineChunk
+from src.guidelines.indexer import GuidelineChunk, GuidelineIndexer
 from src.guidelines.retriever import GuidelineRetriever, RetrievedDocument
 
 
@@ -273,3 +294,234 @@ def test_retrieve_applies_filters_and_returns_guideline_chunks() -> None:
     assert chunk.chunk_id == "chunk-1"
     assert chunk.source.startswith("Fleischner")
     assert chunk.recommendation == "CT chest in 3 months."
+
+
+class _RecordingEmbeddingClient:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.0, 0.0] for text in texts]
+
+
+class _RecordingVectorStore:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def index_batch(self, documents: List[Dict[str, Any]], batch_size: int = 100, **kwargs: Any) -> None:
+        self.calls.append({"documents": list(documents), "batch_size": batch_size, **kwargs})
+
+
+def test_index_all_guidelines_issues_single_bulk_write() -> None:
+    indexer = GuidelineIndexer()
+    embedding_client = _RecordingEmbeddingClient()
+    vector_store = _RecordingVectorStore()
+
+    indexer.index_all_guidelines(
+        "data/guidelines",
+        embedding_client=embedding_client,  # type: ignore[arg-type]
+        vector_store=vector_store,  # type: ignore[arg-type]
+        batch_size=25,
+        bulk_size_bytes=1024 * 1024,
+    )
+
+    assert len(vector_store.calls) == 1
+    call = vector_store.calls[0]
+    assert call["batch_size"] == 25
+    assert call["max_chunk_bytes"] == 1024 * 1024
+
+    documents = call["documents"]
+    embedded_texts = [text for batch in embedding_client.calls for text in batch]
+    assert len(documents) == len(embedded_texts)
+    assert {doc["text"] for doc in documents} == set(embedded_texts)
+    assert all(doc["embedding"][0] == float(len(doc["text"])) for doc in documents)
+    assert all(doc["metadata"]["source"] for doc in documents)
+
+
+def test_index_all_guidelines_worker_pool_matches_serial_chunking(monkeypatch: Any) -> None:
+    from src.guidelines import indexer as indexer_module
+
+    monkeypatch.setattr(indexer_module, "POOL_MIN_BYTES", 0)
+    indexer = GuidelineIndexer()
+    stores = []
+    for workers in (1, 2):
+        vector_store = _RecordingVectorStore()
+        indexer.index_all_guidelines(
+            "data/guidelines",
+            embedding_client=_RecordingEmbeddingClient(),  # type: ignore[arg-type]
+            vector_store=vector_store,  # type: ignore[arg-type]
+            workers=workers,
+        )
+        stores.append(vector_store)
+
+    serial, pooled = ([doc["text"] for doc in store.calls[0]["documents"]] for store in stores)
+    assert pooled == serial
+
+
+def test_index_all_guidelines_chunks_small_sets_in_process(monkeypatch: Any) -> None:
+    from src.guidelines import indexer as indexer_module
+
+    def _no_pool(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("worker pool should not start for a small guideline set")
+
+    monkeypatch.setattr(indexer_module, "ProcessPoolExecutor", _no_pool)
+    for workers in (None, 4):
+        vector_store = _RecordingVectorStore()
+        GuidelineIndexer().index_all_guidelines(
+            "data/guidelines",
+            embedding_client=_RecordingEmbeddingClient(),  # type: ignore[arg-type]
+            vector_store=vector_store,  # type: ignore[arg-type]
+            workers=workers,
+        )
+        assert vector_store.calls
+
+
+def test_index_all_guidelines_pipelined_writes_every_chunk() -> None:
+    class _BatchEmbeddingClient:
+        def __init__(self) -> None:
+            self.batches: List[List[str]] = []
+
+        def embed_texts(self, texts: List[str]) -> List[List[float]]:
+            self.batches.append(list(texts))
+            return [[1.0, 0.0, 0.0] for _ in texts]
+
+    indexer = GuidelineIndexer()
+    embedding_client = _BatchEmbeddingClient()
+    vector_store = _RecordingVectorStore()
+
+    indexer.index_all_guidelines(
+        "data/guidelines",
+        embedding_client=embedding_client,  # type: ignore[arg-type]
+        vector_store=vector_store,  # type: ignore[arg-type]
+        batch_size=2,
+        pipelined=True,
+        upload_concurrency=3,
+    )
+
+    written = [doc for call in vector_store.calls for doc in call["documents"]]
+    embedded = [text for batch in embedding_client.batches for text in batch]
+    assert len(written) == len(embedded) > 0
+    assert len({doc["id"] for doc in written}) == len(written)
+    assert all(len(call["documents"]) >= 2 for call in vector_store.calls[:-1])
+    assert all(call["concurrency"] == 3 for call in vector_store.calls)
+
+
+def test_quantize_embeddings_uses_symmetric_per_row_scale() -> None:
+    from src.services.vector_store import quantize_embeddings
+
+    rows = [[0.5, -0.25, 0.1], [0.0, 0.0, 0.0], [-2.0, 1.0, 0.02]]
+    quantized = quantize_embeddings(rows)
+
+    assert quantized[0] == [127, -64, 25]
+    assert quantized[1] == [0, 0, 0]
+    assert quantized[2] == [-127, 64, 1]
+    assert all(-127 <= value <= 127 for row in quantized for value in row)
+
+
+def test_quantized_cosine_ranking_matches_float_ranking() -> None:
+    import numpy as np
+
+    from src.services.vector_store import quantize_embeddings
+
+    rng = np.random.default_rng(7)
+    query = rng.normal(size=64)
+    noise = rng.normal(size=(6, 64))
+    # Documents drift progressively away from the query and carry unrelated magnitudes.
+    documents = [
+        scale * (query * (1.0 - step / 6) + noise[step] * step / 6)
+        for step, scale in enumerate([0.01, 40.0, 3.0, 0.2, 900.0, 1.0])
+    ]
+
+    def _cosine_ranking(vectors: List[Any], probe: Any) -> List[int]:
+        matrix = np.asarray(vectors, dtype=np.float64)
+        probe = np.asarray(probe, dtype=np.float64)
+        scores = matrix @ probe / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(probe))
+        return list(np.argsort(-scores))
+
+    expected = _cosine_ranking(documents, query)
+    assert expected == list(range(6))
+    quantized_query, *quantized_documents = quantize_embeddings([query, *documents])
+    assert _cosine_ranking(quantized_documents, quantized_query) == expected
+
+
+def test_existing_index_with_float_mapping_is_rejected() -> None:
+    import pytest
+
+    from src.services import vector_store as vector_store_module
+
+    legacy_embedding = {
+        "type": "knn_vector",
+        "dimension": 768,
+        "method": {"name": "hnsw", "space_type": "cosinesimil", "engine": "nmslib"},
+    }
+    store = vector_store_module.VectorStore.__new__(vector_store_module.VectorStore)
+    store.index_name = "test-index"
+    store._logger = vector_store_module.get_logger("tests.vector_store")
+    store._client = types.SimpleNamespace(
+        indices=types.SimpleNamespace(
+            get_mapping=lambda index: {index: {"mappings": {"properties": {"embedding": legacy_embedding}}}},
+        ),
+    )
+
+    with pytest.raises(vector_store_module.VectorStoreError, match="data_type, method.engine"):
+        store._check_embedding_mapping()
+
+    current_embedding = vector_store_module.INDEX_MAPPING["mappings"]["properties"]["embedding"]
+    store._client.indices.get_mapping = lambda index: {
+        index: {"mappings": {"properties": {"embedding": current_embedding}}}
+    }
+    store._check_embedding_mapping()
+
+
+def test_index_batch_splits_uploads_across_concurrent_requests(monkeypatch: Any) -> None:
+    from src.services import vector_store as vector_store_module
+
+    uploaded: List[List[str]] = []
+
+    def _fake_bulk(client: Any, actions: Any, **kwargs: Any) -> tuple[int, list[object]]:
+        ids = [action["_id"] for action in actions]
+        uploaded.append(ids)
+        return len(ids), []
+
+    monkeypatch.setattr(vector_store_module.helpers, "bulk", _fake_bulk)
+    store = vector_store_module.VectorStore.__new__(vector_store_module.VectorStore)
+    store.index_name = "test-index"
+    store._client = object()
+    store._logger = vector_store_module.get_logger("tests.vector_store")
+
+    documents = [
+        {"id": f"doc-{index}", "text": "text", "embedding": [1.0, 0.5], "metadata": {}}
+        for index in range(5)
+    ]
+    store.index_batch(documents, batch_size=2, concurrency=2)
+
+    assert sorted(uploaded) == [["doc-0", "doc-1", "doc-2"], ["doc-3", "doc-4"]]
+
+
+def test_index_all_guidelines_embeds_duplicate_texts_once(monkeypatch: Any) -> None:
+    indexer = GuidelineIndexer()
+    original_chunk = GuidelineIndexer.chunk_guideline
+
+    def _duplicated(self: GuidelineIndexer, content: str, source_name: str) -> List[GuidelineChunk]:
+        chunks = original_chunk(self, content, source_name)
+        if chunks:
+            chunks.append(GuidelineChunk(**{**vars(chunks[0]), "chunk_id": f"{chunks[0].chunk_id}-copy"}))
+        return chunks
+
+    monkeypatch.setattr(GuidelineIndexer, "chunk_guideline", _duplicated)
+    embedding_client = _RecordingEmbeddingClient()
+    vector_store = _RecordingVectorStore()
+
+    indexer.index_all_guidelines(
+        "data/guidelines",
+        embedding_client=embedding_client,  # type: ignore[arg-type]
+        vector_store=vector_store,  # type: ignore[arg-type]
+        workers=1,
+    )
+
+    documents = vector_store.calls[0]["documents"]
+    embedded_texts = [text for batch in embedding_client.calls for text in batch]
+    assert len(embedded_texts) == len(set(embedded_texts))
+    assert len(documents) > len(embedded_texts)
+    assert {doc["text"] for doc in documents} == set(embedded_texts)
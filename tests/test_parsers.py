@@ -6,6 +6,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Iterable
 
+import pytest
+
+from src.parsers.fhir_models import Attachment, DiagnosticReport, Patient
 from src.parsers.fhir_parser import FHIRParser
 from src.parsers.report_parser import Finding, ReportParser, parse_report
 
@@ -138,3 +141,52 @@ def test_validate_diagnostic_report_detects_missing_fields() -> None:
     }
 
     assert parser.validate_diagnostic_report(invalid_report) is False
+
+
+def test_validate_diagnostic_report_rejects_empty_code() -> None:
+    parser = FHIRParser()
+    report = {
+        'resourceType': 'DiagnosticReport',
+        'id': 'report-1',
+        'status': 'final',
+        'code': {},
+        'subject': {'reference': 'Patient/example'},
+        'effectiveDateTime': '2024-01-01T00:00:00Z',
+        'conclusion': 'No acute abnormality.',
+    }
+
+    assert parser.validate_diagnostic_report(report) is False
+
+
+def test_from_fhir_json_checks_the_parsed_resource_type() -> None:
+    raw = Path('data/sample_reports/chest_ct_ggo_fhir.json').read_bytes()
+    assert DiagnosticReport.from_fhir_json(raw) == DiagnosticReport.from_fhir(json.loads(raw))
+
+    observation = json.dumps({
+        'resourceType': 'Observation',
+        'id': 'obs-1',
+        'status': 'final',
+        'code': {'text': 'CT Chest'},
+        'subject': {'reference': 'Patient/example'},
+        'effectiveDateTime': '2024-01-01T00:00:00Z',
+        'derivedFrom': [{'reference': 'DiagnosticReport/report-1', 'type': 'DiagnosticReport'}],
+    })
+    with pytest.raises(ValueError, match="Expected resourceType 'DiagnosticReport'"):
+        DiagnosticReport.from_fhir_json(observation)
+
+    related_person = json.dumps({
+        'resourceType': 'RelatedPerson',
+        'id': 'rp-1',
+        'birthDate': '1980-05-12',
+        'gender': 'female',
+        'patient': {'reference': 'Patient/example', 'type': 'Patient'},
+    })
+    with pytest.raises(ValueError, match="Expected resourceType 'Patient'"):
+        Patient.from_fhir_json(related_person)
+
+
+
+def test_attachment_validates_base64_before_stripping() -> None:
+    assert Attachment(contentType='text/plain', data='aGVsbG8=').data == 'aGVsbG8='
+    with pytest.raises(ValueError, match='must be base64 encoded'):
+        Attachment(contentType='text/plain', data='  aGVsbG8=\n')